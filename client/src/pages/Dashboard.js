@@ -18,20 +18,28 @@ export default function Dashboard() {
             setError(null);
             try {
 
-                const response = await fetch(`http://127.0.0.1:5000/api/get_analysis_by_email?email=${user.email}`, {
-                    method: "GET",
-                    headers: {
-                        "Content-Type": "application/json",
-                        "Authorization": `Bearer ${token}`,
-                    },
-                });
+                // The averages cover the whole history: walk every page, without insights
+                const analyses = [];
+                let cursor = null;
+                do {
+                    const response = await fetch(`http://127.0.0.1:5000/api/get_analysis_by_email?email=${encodeURIComponent(user.email)}` +
+                        `&page_size=100&summary_only=true` + (cursor ? `&cursor=${encodeURIComponent(cursor)}` : ""), {
+                        method: "GET",
+                        headers: {
+                            "Content-Type": "application/json",
+                            "Authorization": `Bearer ${token}`,
+                        },
+                    });
 
-                const json = await response.json();
-                if (response.ok && json.success) {
-                    setData(json.analyses);
-                } else {
-                    setError(json.message || "Failed to load dashboard data");
-                }
+                    const json = await response.json();
+                    if (!response.ok || !json.success) {
+                        setError(json.error || json.message || "Failed to load dashboard data");
+                        return;
+                    }
+                    analyses.push(...json.analyses);
+                    cursor = json.next_cursor;
+                } while (cursor);
+                setData(analyses);
             } catch (err) {
                 setError("Error fetching data");
                 console.error(err);
@@ -5,15 +5,20 @@ import Loader from "../components/Loader";
 import TraitsGrid from "../components/TraitsGrid";
 import InsightsDisplay from "../components/InsightsDisplay";
 import AnalysisHeader from "../components/AnalysisHeader";
+import Button from "../components/Button";
+
+const PAGE_SIZE = 20;
 
 export default function History() {
     const [sample_res, setSample_res] = useState({ analyses: [] });
     const [error, setError] = useState(null);
     const [loaderVisible, setLoaderVisible] = useState(false);
     const [message, setMessage] = useState(null);
+    const [nextCursor, setNextCursor] = useState(null);
     const { token, user } = useContext(UserContext);
 
-    async function getHistory() {
+    // Pages of PAGE_SIZE analyses, newest first; cursor continues after the previous page
+    async function getHistory(cursor = null) {
         setLoaderVisible(true);
         setError(null);
         try {
@@ -21,7 +26,8 @@ export default function History() {
             setMessage("");
             const timeoutMs = 10000;
             const response = await Promise.race([
-                fetch(`http://127.0.0.1:5000/api/get_analysis_by_email?email=${user.email}`, {
+                fetch(`http://127.0.0.1:5000/api/get_analysis_by_email?email=${encodeURIComponent(user.email)}` +
+                    `&page_size=${PAGE_SIZE}` + (cursor ? `&cursor=${encodeURIComponent(cursor)}` : ""), {
                     method: "GET",
                     headers: {
                         "Content-Type": "application/json",
@@ -39,7 +45,11 @@ export default function History() {
 
                 if (response.ok && dataJson.success) {
                     setMessage("History loaded successfully");
-                    setSample_res(dataJson);
+                    setSample_res(previous => ({
+                        ...dataJson,
+                        analyses: cursor ? [...previous.analyses, ...dataJson.analyses] : dataJson.analyses
+                    }));
+                    setNextCursor(dataJson.next_cursor);
                 } else {
                     setError(dataJson.error || dataJson.message ||
                         `Failed to get history`);
@@ -77,6 +87,9 @@ export default function History() {
                         </div>
                     ))}
                 </div>
+                {nextCursor && !loaderVisible && (
+                    <Button text={"Load more"} onClick={() => getHistory(nextCursor)} />
+                )}
             </div>
         </>
     );
@@ -2,25 +2,35 @@ import datetime
 import json
 import os
 import re
+import threading
 import traceback
 
 import pyodbc
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, Response, stream_with_context
 from flask_cors import CORS
 from werkzeug.exceptions import BadRequest, InternalServerError, Conflict, Unauthorized, NotFound
 from flask_jwt_extended import (
     JWTManager, create_access_token, jwt_required, get_jwt_identity, get_jwt
 )
-from Core.OCEANAnalyzer import OceanAnalyzer, download_nltk_resources
-from Core.TextPreProcessor import TextPreprocessor
+from Core.ModelRegistry import ModelRegistry
+from Core.AnalysisPipeline import AnalysisPipeline
+from Core.BatchScraper import scrape_profiles
+from Core.DriverPool import DriverPool, DriverPoolExhausted
+from Core.ScoreStore import ScoreStore
+from Core.TimelineCache import TimelineCache
 from Core.TweetScraper import TwitterScraper
 from Operation.User import User
 from Operation.Analysis import Analysis
+from Operation.AnalysisWriter import AnalysisWriter
+from Operation.ConnectionPool import configure_pools, pool_stats
 
 
 class PersonaInsight:
     """Main class for the PersonaInsight API application"""
 
+    # Upper bound for /api/tweets/batch requests
+    MAX_BATCH_PROFILES = 500
+
     def __init__(self, jwt_secret_key='PersonaInsight', jwt_expires=datetime.timedelta(hours=1)):
 
         self.app = Flask(__name__)
@@ -47,9 +57,52 @@ class PersonaInsight:
         self.db_username = r'LATITUDE-7490\Owais'
         self.trusted_connection = True
 
-        # Analysis components
-        self.preprocessor = None
-        self.ocean_analyzer = None
+        # User and Analysis borrow connections from a shared per-process pool
+        configure_pools(
+            min_size=int(os.environ.get('DB_POOL_MIN_SIZE', 1)),
+            max_size=int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+            acquire_timeout=float(os.environ.get('DB_POOL_TIMEOUT', 10.0))
+        )
+
+        # Warm Chrome drivers shared by the scraping routes
+        self.driver_pool = DriverPool(
+            size=int(os.environ.get('SCRAPER_POOL_SIZE', 2)),
+            headless=os.environ.get('SCRAPER_HEADLESS', 'true').lower() != 'false',
+            max_uses=int(os.environ.get('SCRAPER_MAX_USES', 50)),
+            acquire_timeout=float(os.environ.get('SCRAPER_ACQUIRE_TIMEOUT', 30.0)),
+            lean=os.environ.get('SCRAPER_LEAN', 'true').lower() != 'false',
+            # 'network' reads the timeline API responses and falls back to the DOM ('script')
+            extraction_mode=os.environ.get('SCRAPER_EXTRACTION', 'network')
+        )
+
+        # Scraped timelines are reused within TIMELINE_CACHE_TTL seconds and topped up after it
+        self.timeline_cache = TimelineCache(
+            cache_dir=os.environ.get('TIMELINE_CACHE_DIR', '../timeline_cache'),
+            ttl_seconds=float(os.environ.get('TIMELINE_CACHE_TTL', 60 * 60))
+        )
+
+        # Per-tweet OCEAN scores, so re-analysing a profile only scores its new tweets
+        self.score_store = ScoreStore(store_dir=os.environ.get('SCORE_STORE_DIR', '../score_store'))
+
+        # Analyses are saved by a background write-behind queue (started by run() or on first use)
+        self.analysis_writer = AnalysisWriter(
+            connection_params={
+                'server': self.server,
+                'database': self.database,
+                'trusted_connection': self.trusted_connection
+            },
+            spill_file=os.environ.get('ANALYSIS_SPILL_FILE', '../pending_analyses.jsonl'),
+            dead_letter_file=os.environ.get('ANALYSIS_DEAD_LETTER_FILE', '../failed_analyses.jsonl')
+        )
+
+        # Analysis components, loaded once per process by warm_up() or the first analysis request
+        # 'keras', 'tflite' or 'numpy' (exported runtime models, no TensorFlow import needed)
+        self.inference_backend = os.environ.get('OCEAN_BACKEND', 'keras')
+        self.models = ModelRegistry(
+            backend=self.inference_backend,
+            max_batch_size=int(os.environ.get('INFERENCE_MAX_BATCH_SIZE', 64)),
+            max_wait_ms=float(os.environ.get('INFERENCE_MAX_WAIT_MS', 5.0))
+        )
 
         # Register routes
         self._register_routes()
@@ -57,47 +110,42 @@ class PersonaInsight:
         # Register error handlers
         self._register_error_handlers()
 
-        # Add before_request handler for model initialization
-        self.app.before_request(self.initialize_models)
-
         self.token_blacklist = set()
 
         # Add JWT callbacks
         self._register_jwt_callbacks()
 
-    def initialize_models(self):
-        """Initialize the OCEAN analyzer before handling the first request."""
-        # Skip initialization for static resources
-        if request.path.startswith('/static'):
-            return
-
-        # Only initialize if not already done
-        if self.preprocessor is None or self.ocean_analyzer is None:
-            # Download NLTK resources
-            download_nltk_resources()
-
-            # Initialize the text preprocessor
-            self.preprocessor = TextPreprocessor()
-
-            # Initialize the OCEAN analyzer
-            self.ocean_analyzer = OceanAnalyzer(self.preprocessor)
+    def warm_up(self):
+        """
+        Load the preprocessor, tokenizer and OCEAN model and run a dummy inference so the
+        graph is traced before any user request arrives.
+        """
+        try:
+            self.models.warm_up()
+        except Exception as e:
+            print(f"Model warm-up failed: {str(e)}")
+            print(traceback.format_exc())
+            raise
+        print(f"Models warmed up in {self.models.load_seconds:.1f}s, ready to serve")
 
-            # Try to load existing model first
-            model_loaded = self.ocean_analyzer.load_model()
+    def start_warm_up(self):
+        """Warm the models up in a background thread while the server starts listening."""
+        def run():
+            try:
+                self.warm_up()
+            except Exception:
+                pass  # Already logged; readiness keeps reporting the error
 
-            if not model_loaded:
-                print("OCEAN model not found. Training new model...")
-                ocean_df = self.ocean_analyzer.load_data('mypersonality_final.csv')
-                X_train, X_test, y_train, y_test = self.ocean_analyzer.prepare_data(ocean_df)
-                self.ocean_analyzer.train(X_train, y_train, X_test, y_test)
-            else:
-                print("Using pre-trained OCEAN model")
+        thread = threading.Thread(target=run, name='ModelWarmUp', daemon=True)
+        thread.start()
+        return thread
 
     def _register_routes(self):
         """Register all API routes with the Flask app"""
         # Route definitions
         routes = [
             ('/', ['GET'], self.index),
+            ('/api/ready', ['GET'], self.readiness),
             ('/analyze', ['POST'], self.analyze_tweets),
             ('/api/add_user', ['POST'], self.add_user),
             ('/api/users/login', ['POST'], self.login_user),
@@ -107,10 +155,15 @@ class PersonaInsight:
             ('/api/tweets/username/<username>', ['GET'], self.get_tweets_by_username),
             ('/api/tweet'
              's/url', ['GET'], self.get_tweets_by_url),
+            ('/api/tweets/batch', ['POST'], self.get_tweets_batch),
             ('/api/analyze_profile', ['GET'], self.analyze_profile),
             ('/api/profile_info', ['GET'], self.get_profile_info),
             ('/api/logout', ['GET'], self.logout_user, True),
-            ('/api/get_analysis_by_email', ['GET'], self.get_user_analyses)
+            ('/api/get_analysis_by_email', ['GET'], self.get_user_analyses),
+            ('/api/inference_stats', ['GET'], self.get_inference_stats),
+            ('/api/db_pool_stats', ['GET'], self.get_db_pool_stats),
+            ('/api/analysis_status/<pending_id>', ['GET'], self.get_analysis_status),
+            ('/api/scraper_pool_stats', ['GET'], self.get_scraper_pool_stats)
         ]
 
         # Register each route
@@ -205,6 +258,17 @@ class PersonaInsight:
         """Root endpoint handler"""
         return "PersonaInsight and Twitter Scraper Server Up & Running"
 
+    def readiness(self):
+        """Readiness probe: 200 once the models are loaded and warmed up, 503 before that"""
+        ready = self.models.ready
+        response = {
+            'ready': ready,
+            'backend': self.inference_backend,
+            'warm_up_seconds': self.models.load_seconds,
+            'error': self.models.error
+        }
+        return jsonify(response), 200 if ready else 503
+
     def analyze_tweets(self):
         """
         API route to analyze provided tweets
@@ -227,17 +291,19 @@ class PersonaInsight:
                     'error': 'No tweets provided for analysis.'
                 }), 400
 
+            models = self.models.get()
+
             # Preprocess tweets
-            preprocessed_tweets = [self.preprocessor.preprocess_text(tweet) for tweet in tweets]
+            preprocessed_tweets = models.preprocessor.preprocess_many(tweets)
 
             # Analyze tweets
-            results = self.ocean_analyzer.analyze(preprocessed_tweets)
+            results = models.inference_batcher.analyze(preprocessed_tweets)
 
             # Calculate average scores
-            average_scores = self.ocean_analyzer.calculate_average_scores(results)
+            average_scores = models.ocean_analyzer.calculate_average_scores(results)
 
             # Generate personality summary
-            personality_summary_text = self.ocean_analyzer.generate_personality_summary(results)
+            personality_summary_text = models.ocean_analyzer.generate_personality_summary(results)
 
             # Parse and structure the summary text into components
             structured_summary = self.parse_personality_summary(personality_summary_text)
@@ -569,27 +635,25 @@ class PersonaInsight:
             if count <= 0 or count > 100:
                 return jsonify({"error": "Count must be between 1 and 100"}), 400
 
-            # Initialize scraper
-            scraper = TwitterScraper(headless=False)
-
-            try:
-                # Scrape tweets
-                tweets = scraper.scrape_tweets(username, is_url=False, num_tweets=count)
-
-                if tweets is None:
-                    return jsonify({
-                        "error": "Cannot access tweets",
-                        "message": "Profile is private or does not exist"
-                    }), 403
+            # Serve from the timeline cache, scraping only what it cannot
+            records, source = self.timeline_cache.get_tweets(self.driver_pool, username, is_url=False, num_tweets=count)
 
+            if records is None:
                 return jsonify({
-                    "username": username,
-                    "count": len(tweets),
-                    "tweets": tweets
-                })
+                    "error": "Cannot access tweets",
+                    "message": "Profile is private or does not exist"
+                }), 403
 
-            finally:
-                scraper.close()
+            tweets = [record['text'] for record in records]
+            return jsonify({
+                "username": username,
+                "count": len(tweets),
+                "tweets": tweets,
+                "source": source
+            })
+
+        except DriverPoolExhausted as e:
+            return jsonify({"error": "Scraper busy", "message": str(e)}), 503, {'Retry-After': '5'}
 
         except Exception as e:
             return jsonify({"error": str(e)}), 500
@@ -614,35 +678,80 @@ class PersonaInsight:
             if count <= 0 or count > 100:
                 return jsonify({"error": "Count must be between 1 and 100"}), 400
 
-            # Initialize scraper
-            scraper = TwitterScraper(headless=False)
+            # Extract username from URL for response
+            username = TwitterScraper.extract_username_from_url(url)
 
-            try:
-                # Extract username from URL for response
-                username = scraper.extract_username_from_url(url)
-
-                # Scrape tweets
-                tweets = scraper.scrape_tweets(url, is_url=True, num_tweets=count)
-
-                if tweets is None:
-                    return jsonify({
-                        "error": "Cannot access tweets",
-                        "message": "Profile is private or does not exist"
-                    }), 403
+            # Serve from the timeline cache, scraping only what it cannot
+            records, source = self.timeline_cache.get_tweets(self.driver_pool, url, is_url=True, num_tweets=count)
 
+            if records is None:
                 return jsonify({
-                    "username": username,
-                    "url": url,
-                    "count": len(tweets),
-                    "tweets": tweets
-                })
+                    "error": "Cannot access tweets",
+                    "message": "Profile is private or does not exist"
+                }), 403
 
-            finally:
-                scraper.close()
+            tweets = [record['text'] for record in records]
+            return jsonify({
+                "username": username,
+                "url": url,
+                "count": len(tweets),
+                "tweets": tweets,
+                "source": source
+            })
+
+        except DriverPoolExhausted as e:
+            return jsonify({"error": "Scraper busy", "message": str(e)}), 503, {'Retry-After': '5'}
 
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
+    def get_tweets_batch(self):
+        """
+        API route to scrape many profiles concurrently, streaming one JSON line per profile
+        as soon as it finishes, followed by a summary line
+        Example: POST /api/tweets/batch {"profiles": ["twitter", "https://twitter.com/x"], "count": 20, "concurrency": 2}
+        """
+        data = request.get_json(silent=True) or {}
+        profiles = data.get('profiles')
+        count = data.get('count', 20)
+        concurrency = data.get('concurrency')
+
+        # Validate parameters
+        if not isinstance(profiles, list) or not profiles or not all(isinstance(p, str) and p.strip() for p in profiles):
+            return jsonify({"error": "profiles must be a non-empty list of usernames or URLs"}), 400
+
+        if len(profiles) > self.MAX_BATCH_PROFILES:
+            return jsonify({"error": f"At most {self.MAX_BATCH_PROFILES} profiles per batch"}), 400
+
+        if not isinstance(count, int) or count <= 0 or count > 100:
+            return jsonify({"error": "Count must be between 1 and 100"}), 400
+
+        if concurrency is not None and (not isinstance(concurrency, int) or concurrency <= 0):
+            return jsonify({"error": "Concurrency must be a positive integer"}), 400
+
+        profiles = [p.strip() for p in profiles]
+
+        def generate():
+            started = datetime.datetime.now()
+            succeeded = 0
+            failed = {}
+            for result in scrape_profiles(self.driver_pool, profiles, num_tweets=count, concurrency=concurrency):
+                if result['status'] == 'ok':
+                    succeeded += 1
+                else:
+                    failed[result['identifier']] = result['error']
+                yield json.dumps(result) + '\n'
+
+            yield json.dumps({
+                'summary': True,
+                'profiles': len(set(profiles)),
+                'succeeded': succeeded,
+                'failed': failed,
+                'seconds': (datetime.datetime.now() - started).total_seconds()
+            }) + '\n'
+
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
     def analyze_profile(self):
         """
         Combined endpoint that scrapes tweets, performs personality analysis, and saves results to database
@@ -669,94 +778,93 @@ class PersonaInsight:
             is_url = url is not None
             identifier = url if is_url else username
 
-            # Initialize scraper
-            scraper = TwitterScraper(headless=True)
+            # Get username for response
+            profile_username = username if not is_url else TwitterScraper.extract_username_from_url(url)
+
+            models = self.models.get()
+            model_version = models.ocean_analyzer.model_version()
 
+            # Score newly scraped tweets while the scraper keeps scrolling; stored scores are skipped
+            pipeline = AnalysisPipeline(models.preprocessor, models.inference_batcher,
+                                        skip_ids=self.score_store.load(profile_username, model_version))
+            pipeline.start()
             try:
-                # Scrape tweets
-                tweets = scraper.scrape_tweets(identifier, is_url=is_url, num_tweets=count)
-
-                if tweets is None:
-                    return jsonify({
-                        "error": "Cannot access tweets",
-                        "message": "Profile is private or does not exist"
-                    }), 403
-
-                # Get username for response
-                profile_username = username if not is_url else scraper.extract_username_from_url(url)
-
-                # Preprocess tweets
-                preprocessed_tweets = [self.preprocessor.preprocess_text(tweet) for tweet in tweets]
-
-                # Analyze tweets
-                results = self.ocean_analyzer.analyze(preprocessed_tweets)
-
-                # Calculate average scores
-                average_scores = self.ocean_analyzer.calculate_average_scores(results)
-
-                # Generate personality summary
-                personality_summary_text = self.ocean_analyzer.generate_personality_summary(results)
-
-                # Parse and structure the summary text into components
-                structured_summary = self.parse_personality_summary(personality_summary_text)
-
-                # Prepare response
-                response = {
-                    'username': profile_username,
-                    'tweets_analyzed': len(tweets),
-                    'tweets': tweets,
-                    'individual_results': results,
-                    'average_scores': average_scores,
-                    'summary': structured_summary
-                }
-
-                # Save to database only if email is provided and analysis was successful
-                if email:
-                    try:
-                        analysis = Analysis(
-                            email=email,
-                            username=profile_username,
-                            tweets_count=len(tweets),
-                            average_scores=average_scores
-                        )
-
-                        # Convert insights into properly formatted list for Analysis class
-                        insights = []
-                        for insight_type, insight_list in structured_summary.items():
-                            if insight_list:  # Only add if there are insights for this type
-                                insights.append({
-                                    'type': insight_type,  # Keep original camelCase for consistency
-                                    'text': ", ".join(insight_list)
-                                })
-
-                        # Set insights to the analysis object
-                        analysis.insights = insights
-
-                        # Get database connection parameters from the current instance
-                        analysis.get_connection(
-                            server=self.server,
-                            database=self.database,
-                            trusted_connection=self.trusted_connection
-                        )
-
-                        # Save the analysis
-                        analysis_id = analysis.add_analysis()
-                        response['analysis_id'] = analysis_id
-                        response['saved_to_db'] = True
-                    except Exception as db_error:
-                        # Log the database error but don't fail the request
-                        print(f"Failed to save analysis to database: {str(db_error)}")
-                        print(traceback.format_exc())
-                        response['saved_to_db'] = False
-                        response['db_error'] = str(db_error)
-                else:
+                # Serve from the timeline cache, scraping only what it cannot
+                records, source = self.timeline_cache.get_tweets(self.driver_pool, identifier, is_url=is_url,
+                                                                 num_tweets=count, on_tweet=pipeline.submit)
+            finally:
+                pipeline.stop()
+
+            if records is None:
+                return jsonify({
+                    "error": "Cannot access tweets",
+                    "message": "Profile is private or does not exist"
+                }), 403
+
+            tweets = [record['text'] for record in records]
+
+            # Analyze only the tweets without stored scores; scraped ones are mostly scored already
+            results, average_scores, tweets_scored = self.score_store.score(
+                profile_username, records, pipeline.analyze, model_version)
+
+            # Generate personality summary
+            personality_summary_text = models.ocean_analyzer.generate_personality_summary(results)
+
+            # Parse and structure the summary text into components
+            structured_summary = self.parse_personality_summary(personality_summary_text)
+
+            # Prepare response
+            response = {
+                'username': profile_username,
+                'tweets_analyzed': len(tweets),
+                'tweets_scored': tweets_scored,
+                'tweets': tweets,
+                'individual_results': results,
+                'average_scores': average_scores,
+                'summary': structured_summary
+            }
+
+            # Save to database only if email is provided and analysis was successful
+            if email:
+                try:
+                    analysis = Analysis(
+                        email=email,
+                        username=profile_username,
+                        tweets_count=len(tweets),
+                        average_scores=average_scores
+                    )
+
+                    # Convert insights into properly formatted list for Analysis class
+                    insights = []
+                    for insight_type, insight_list in structured_summary.items():
+                        if insight_list:  # Only add if there are insights for this type
+                            insights.append({
+                                'type': insight_type,  # Keep original camelCase for consistency
+                                'text': ", ".join(insight_list)
+                            })
+
+                    # Set insights to the analysis object
+                    analysis.insights = insights
+
+                    # Queue the analysis; it is written in the background
+                    pending_id = self.analysis_writer.submit(analysis)
+                    response['pending_id'] = pending_id
                     response['saved_to_db'] = False
-                    response['message'] = "Analysis not saved to database (no email provided)"
+                    response['message'] = f"Analysis queued for saving, see /api/analysis_status/{pending_id}"
+                except Exception as db_error:
+                    # Log the error but don't fail the request
+                    print(f"Failed to queue analysis for saving: {str(db_error)}")
+                    print(traceback.format_exc())
+                    response['saved_to_db'] = False
+                    response['db_error'] = str(db_error)
+            else:
+                response['saved_to_db'] = False
+                response['message'] = "Analysis not saved to database (no email provided)"
 
-                return jsonify(response), 200
+            return jsonify(response), 200
 
-            finally:
-                scraper.close()
+        except DriverPoolExhausted as e:
+            return jsonify({"error": "Scraper busy", "message": str(e)}), 503, {'Retry-After': '5'}
 
         except Exception as e:
             # Don't attempt to save anything if there was an error in analysis
@@ -769,9 +877,15 @@ class PersonaInsight:
         """
         API endpoint to retrieve all analyses for the authenticated user
 
+        Analyses are paged newest first: page_size (1 to Analysis.MAX_PAGE_SIZE, default
+        Analysis.DEFAULT_PAGE_SIZE) bounds each response and cursor continues from the previous
+        page's next_cursor. summary_only=true omits the insights.
+        Example: /api/get_analysis_by_email?email=a@b.com&page_size=20&summary_only=true
+
         Returns:
             JSON response containing:
             - analyses: List of analysis records with insights
+            - next_cursor: Cursor for the following page (None on the last page)
             - success: Boolean indicating success
             - error: Error message if any (None if successful)
         """
@@ -782,6 +896,16 @@ class PersonaInsight:
             # Debug logging
             print(f"Fetching analyses for user: {current_user_email}")
 
+            page_size = request.args.get('page_size', default=str(Analysis.DEFAULT_PAGE_SIZE), type=str)
+            if not page_size.isdigit() or not 1 <= int(page_size) <= Analysis.MAX_PAGE_SIZE:
+                raise ValueError(f"page_size must be an integer between 1 and {Analysis.MAX_PAGE_SIZE}")
+            page_size = int(page_size)
+            cursor = request.args.get('cursor', default=None, type=str)
+            if cursor:
+                # Reject a malformed cursor before opening a connection
+                Analysis.decode_cursor(cursor)
+            summary_only = request.args.get('summary_only', default='false', type=str).lower() == 'true'
+
             # Get analyses using the Analysis class
             analysis = Analysis()
             analysis.get_connection(
@@ -790,14 +914,20 @@ class PersonaInsight:
                 trusted_connection=self.trusted_connection
             )
 
-            analyses = analysis.get_analyses_by_user(current_user_email)
+            analyses = analysis.get_analyses_by_user(
+                current_user_email,
+                page_size=page_size,
+                cursor=cursor,
+                summary_only=summary_only
+            )
 
             # Format the response
             response = {
                 'analyses': analyses,
                 'success': True,
                 'error': None,
-                'count': len(analyses)
+                'count': len(analyses),
+                'next_cursor': analysis.next_cursor
             }
 
             return jsonify(response), 200
@@ -826,6 +956,44 @@ class PersonaInsight:
                 'count': 0
             }), 500
 
+    def get_inference_stats(self):
+        """
+        Endpoint exposing micro-batching histograms for tuning throughput vs. p99 latency
+        Example: /api/inference_stats
+        """
+        if not self.models.ready:
+            return jsonify({"error": "Inference batcher not initialized"}), 503
+
+        return jsonify(self.models.get().inference_batcher.stats()), 200
+
+    def get_analysis_status(self, pending_id):
+        """
+        Endpoint to look up whether a queued analysis has been saved
+
+        Statuses are kept in memory by the worker that queued the analysis; other workers,
+        or the same one after a restart, answer 404 until they replay the spilled record.
+        Example: /api/analysis_status/<pending_id>
+        """
+        status = self.analysis_writer.status(pending_id)
+        if status is None:
+            return jsonify({"error": "Unknown pending analysis ID"}), 404
+
+        return jsonify({'pending_id': pending_id, **status}), 200
+
+    def get_scraper_pool_stats(self):
+        """
+        Endpoint exposing Chrome driver pool utilisation, checkout waits and launch times
+        Example: /api/scraper_pool_stats
+        """
+        return jsonify(self.driver_pool.stats()), 200
+
+    def get_db_pool_stats(self):
+        """
+        Endpoint exposing database connection pool utilisation and checkout wait times
+        Example: /api/db_pool_stats
+        """
+        return jsonify(pool_stats()), 200
+
     def get_profile_info(self):
         """
         Endpoint to fetch basic profile information
@@ -847,23 +1015,21 @@ class PersonaInsight:
             is_url = url is not None
             identifier = url if is_url else username
 
-            # Initialize scraper
-            scraper = TwitterScraper(headless=True)
-
-            try:
+            # Borrow a warm scraper from the driver pool; a driver that raised is discarded
+            with self.driver_pool.scraper() as scraper:
                 # Scrape profile info
                 profile_info = scraper.scrape_profile_info(identifier, is_url=is_url)
 
-                if profile_info is None:
-                    return jsonify({
-                        "error": "Cannot access profile",
-                        "message": "Profile does not exist or is unavailable"
-                    }), 404
+            if profile_info is None:
+                return jsonify({
+                    "error": "Cannot access profile",
+                    "message": "Profile does not exist or is unavailable"
+                }), 404
 
-                return jsonify(profile_info), 200
+            return jsonify(profile_info), 200
 
-            finally:
-                scraper.close()
+        except DriverPoolExhausted as e:
+            return jsonify({"error": "Scraper busy", "message": str(e)}), 503, {'Retry-After': '5'}
 
         except Exception as e:
             return jsonify({"error": str(e)}), 500
@@ -917,6 +1083,12 @@ class PersonaInsight:
 
     def run(self, host='0.0.0.0', port=5000, debug=True):
         """Run the Flask application"""
+        # With the debug reloader the parent process only watches files; warm up in the serving child
+        if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+            self.start_warm_up()
+            self.driver_pool.prewarm(background=True)
+            # Replays analyses spilled before a restart without waiting for the next submit
+            self.analysis_writer.start()
         self.app.run(host=host, port=port, debug=debug)
 
 
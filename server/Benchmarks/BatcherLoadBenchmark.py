@@ -0,0 +1,67 @@
+import sys
+import threading
+import time
+
+from Core.InferenceBatcher import InferenceBatcher
+
+
+class SlowAnalyzer:
+    """Stand-in for OceanAnalyzer whose predict takes a fixed time regardless of batch size"""
+
+    def __init__(self, predict_ms):
+        self.predict_seconds = predict_ms / 1000.0
+        self.batch_sizes = []
+
+    def analyze(self, texts):
+        self.batch_sizes.append(len(texts))
+        time.sleep(self.predict_seconds)
+        return [{'text': text, 'ocean_scores': {}} for text in texts]
+
+
+def run_load(requests=60, interval_ms=5.0, predict_ms=50.0, max_batch_size=64, max_wait_ms=5.0):
+    """
+    Send single-text requests at a fixed rate, each from its own thread, against a slow predict
+
+    Returns:
+        list: Batch size of every predict call
+    """
+    analyzer = SlowAnalyzer(predict_ms)
+    batcher = InferenceBatcher(analyzer, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    batcher.start()
+
+    threads = []
+    try:
+        for i in range(requests):
+            thread = threading.Thread(target=batcher.analyze, args=([f"text {i}"],), kwargs={'timeout': 30})
+            thread.start()
+            threads.append(thread)
+            time.sleep(interval_ms / 1000.0)
+        for thread in threads:
+            thread.join()
+    finally:
+        batcher.stop()
+    return analyzer.batch_sizes
+
+
+def main():
+    batch_sizes = run_load()
+
+    print("\n" + "=" * 60)
+    print("INFERENCE BATCHER UNDER LOAD (1 request / 5 ms, 50 ms predict)".center(60))
+    print("=" * 60)
+    print(f"  predict calls: {len(batch_sizes)}")
+    print(f"  batch sizes:   {batch_sizes}")
+
+    # Requests arriving during a predict must share the next one
+    assert sum(batch_sizes) == 60, "Every request must be served exactly once"
+    assert max(batch_sizes) >= 5, f"Batches did not grow under load: {batch_sizes}"
+    assert len(batch_sizes) <= 20, f"Too many predict calls for the load: {len(batch_sizes)}"
+    print("  OK: batches grow while predict is busy")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except AssertionError as e:
+        print(f"  FAILED: {e}")
+        sys.exit(1)
@@ -0,0 +1,150 @@
+import datetime
+import sqlite3
+import sys
+import time
+
+from Operation.Analysis import Analysis
+
+INSIGHT_TYPES = ['GENERAL_INSIGHTS', 'ADDITIONAL_INSIGHTS', 'RELATIONSHIP_INSIGHTS', 'WORK_INSIGHTS']
+
+# SQLite stand-in for the SQL Server schema used by Operation.Analysis
+SCHEMA = """
+CREATE TABLE ANALYSIS (
+    ANALYSIS_ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    EMAIL TEXT NOT NULL,
+    USERNAME TEXT NOT NULL,
+    TWEETS_COUNT INTEGER NOT NULL,
+    AVERAGE_AGREEABLENESS REAL,
+    AVERAGE_CONSCIENTIOUSNESS REAL,
+    AVERAGE_EXTRAVERSION REAL,
+    AVERAGE_NEUROTICISM REAL,
+    AVERAGE_OPENNESS REAL,
+    ANALYSIS_DATE TEXT NOT NULL
+);
+CREATE TABLE INSIGHTS (
+    INSIGHT_ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    ANALYSIS_ID INTEGER NOT NULL REFERENCES ANALYSIS (ANALYSIS_ID),
+    INSIGHT_TYPE TEXT NOT NULL,
+    INSIGHT_TEXT TEXT
+);
+CREATE INDEX IX_ANALYSIS_EMAIL ON ANALYSIS (EMAIL, ANALYSIS_DATE);
+CREATE INDEX IX_INSIGHTS_ANALYSIS ON INSIGHTS (ANALYSIS_ID);
+"""
+
+
+class LatencyConnection:
+    """Wraps a DB-API connection and sleeps on every execute to mimic a network round-trip"""
+
+    def __init__(self, connection, latency_ms):
+        self.connection = connection
+        self.latency = latency_ms / 1000.0
+        self.round_trips = 0
+
+    def cursor(self):
+        return LatencyCursor(self, self.connection.cursor())
+
+    def close(self):
+        self.connection.close()
+
+
+class LatencyCursor:
+    def __init__(self, owner, cursor):
+        self.owner = owner
+        self.cursor = cursor
+
+    def execute(self, query, params=()):
+        self.owner.round_trips += 1
+        time.sleep(self.owner.latency)
+        return self.cursor.execute(query, params)
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+
+def seed_database(analyses=1000, email='power.user@example.com'):
+    """
+    Create an in-memory database holding one user's analysis history
+
+    Args:
+        analyses (int): Number of ANALYSIS rows (each gets one insight per type)
+        email (str): Owner of the analyses
+
+    Returns:
+        sqlite3.Connection: Seeded connection
+    """
+    connection = sqlite3.connect(':memory:', check_same_thread=False)
+    connection.executescript(SCHEMA)
+    started = datetime.datetime(2024, 1, 1)
+
+    cursor = connection.cursor()
+    for i in range(analyses):
+        cursor.execute(
+            "INSERT INTO ANALYSIS (EMAIL, USERNAME, TWEETS_COUNT, AVERAGE_AGREEABLENESS, AVERAGE_CONSCIENTIOUSNESS, "
+            "AVERAGE_EXTRAVERSION, AVERAGE_NEUROTICISM, AVERAGE_OPENNESS, ANALYSIS_DATE) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (email, f'profile_{i}', 100, 3.1, 3.2, 3.3, 2.4, 3.5,
+             (started + datetime.timedelta(minutes=i)).isoformat(sep=' '))
+        )
+        analysis_id = cursor.lastrowid
+        cursor.executemany(
+            "INSERT INTO INSIGHTS (ANALYSIS_ID, INSIGHT_TYPE, INSIGHT_TEXT) VALUES (?, ?, ?)",
+            [(analysis_id, insight_type, f'{insight_type.lower()} for profile_{i}') for insight_type in INSIGHT_TYPES]
+        )
+    connection.commit()
+    return connection
+
+
+def legacy_get_analyses_by_user(connection, email):
+    """The original implementation: one insights query per analysis"""
+    cursor = connection.cursor()
+    cursor.execute("SELECT * FROM ANALYSIS WHERE EMAIL = ? ORDER BY ANALYSIS_DATE DESC", (email,))
+    analyses = cursor.fetchall()
+    columns = [column[0] for column in cursor.description]
+
+    analysis_list = []
+    for analysis in analyses:
+        analysis_dict = dict(zip(columns, analysis))
+        cursor.execute("SELECT * FROM INSIGHTS WHERE ANALYSIS_ID = ? ORDER BY INSIGHT_TYPE",
+                       (analysis_dict['ANALYSIS_ID'],))
+        insights = cursor.fetchall()
+        if insights:
+            insight_columns = [column[0] for column in cursor.description]
+            analysis_dict['insights'] = [dict(zip(insight_columns, insight)) for insight in insights]
+        analysis_list.append(analysis_dict)
+    return analysis_list
+
+
+def time_history(fn, connection, email, repeats=5):
+    """Mean latency (ms) and round-trips of one history fetch"""
+    connection.round_trips = 0
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn(email)
+    return (time.perf_counter() - start) * 1000.0 / repeats, connection.round_trips // repeats, result
+
+
+def main(analyses=1000, latency_ms=0.5):
+    email = 'power.user@example.com'
+    connection = LatencyConnection(seed_database(analyses, email), latency_ms)
+
+    analysis = Analysis()
+    analysis.connection = connection
+
+    legacy_ms, legacy_trips, legacy_result = time_history(
+        lambda user: legacy_get_analyses_by_user(connection, user), connection, email)
+    batched_ms, batched_trips, batched_result = time_history(analysis.get_analyses_by_user, connection, email)
+
+    if legacy_result != batched_result:
+        raise AssertionError("Batched history differs from the per-analysis implementation")
+
+    print("\n" + "=" * 50)
+    print(f"HISTORY QUERY BENCHMARK ({analyses} analyses)".center(50))
+    print("=" * 50)
+    print(f"Simulated round-trip latency: {latency_ms} ms")
+    print(f"  {'per-analysis (N+1)':<20}{legacy_ms:>10.1f} ms {legacy_trips:>6} queries")
+    print(f"  {'batched':<20}{batched_ms:>10.1f} ms {batched_trips:>6} queries")
+    print(f"  Speed-up: {legacy_ms / batched_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main(latency_ms=float(sys.argv[1]) if len(sys.argv) > 1 else 0.5)
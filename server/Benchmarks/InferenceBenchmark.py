@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+import time
+
+from Core.OCEANAnalyzer import OceanAnalyzer, SAMPLE_TEXTS
+from Core.InferenceBackend import KerasBackend, TFLiteBackend, NumpyBackend
+
+
+def time_backend(backend, padded_sequences, repeats=20):
+    """
+    Time a backend over the same padded batch
+
+    Args:
+        backend: InferenceBackend to benchmark
+        padded_sequences: Padded [batch, max_length] int32 matrix
+        repeats (int): Number of timed runs after one warm-up run
+
+    Returns:
+        float: Mean latency per batch in milliseconds
+    """
+    backend.predict(padded_sequences)  # Warm-up (tracing, tensor allocation)
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        backend.predict(padded_sequences)
+    return (time.perf_counter() - start) * 1000.0 / repeats
+
+
+def time_import(statement):
+    """Measure the cold import time of a statement in a fresh interpreter (ms)"""
+    code = f"import time; t = time.perf_counter(); {statement}; print((time.perf_counter() - t) * 1000)"
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=os.getcwd())
+    return float(output.stdout.strip()) if output.returncode == 0 else None
+
+
+def main(batch_sizes=(1, 16, 128, 1024)):
+    analyzer = OceanAnalyzer(preprocessor=None)
+    if not analyzer.load_model():
+        print("OCEAN Keras model not found. Train it and run OCEANAnalyzer.py --export-runtime first.")
+        return
+    if not os.path.exists(analyzer.weights_file):
+        analyzer.export_runtime_model()
+
+    backends = [
+        ('keras model.predict', KerasBackend(analyzer.model, analyzer.max_length, mode='predict')),
+        ('keras tf.function', KerasBackend(analyzer.model, analyzer.max_length, mode='compiled')),
+        ('numpy', NumpyBackend(analyzer.weights_file))
+    ]
+    if os.path.exists(analyzer.runtime_model_file):
+        backends.append(('tflite', TFLiteBackend(analyzer.runtime_model_file)))
+
+    print("\n" + "=" * 60)
+    print("OCEAN INFERENCE BENCHMARK (mean ms per batch)".center(60))
+    print("=" * 60)
+    print(f"{'backend':<22}" + "".join(f"{'batch=' + str(size):>10}" for size in batch_sizes))
+
+    for label, backend in backends:
+        row = f"{label:<22}"
+        for size in batch_sizes:
+            texts = (SAMPLE_TEXTS * (size // len(SAMPLE_TEXTS) + 1))[:size]
+            padded_sequences = analyzer.vocabulary.texts_to_padded(texts, analyzer.max_length)
+            row += f"{time_backend(backend, padded_sequences):>10.2f}"
+        print(row)
+
+    print("\nCold import time (ms):")
+    for label, statement in [
+        ('tensorflow.keras', 'import tensorflow.keras'),
+        ('Core.InferenceBackend', 'import Core.InferenceBackend')
+    ]:
+        elapsed = time_import(statement)
+        print(f"  {label:<22}{elapsed:.0f}" if elapsed is not None else f"  {label:<22}failed")
+
+
+if __name__ == "__main__":
+    main()
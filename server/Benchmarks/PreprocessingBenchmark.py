@@ -0,0 +1,79 @@
+import re
+import sys
+import time
+
+from nltk.corpus import stopwords
+from nltk.stem import WordNetLemmatizer
+
+from Core.NLTKResources import download_nltk_resources
+from Core.OCEANAnalyzer import SAMPLE_TEXTS
+from Core.TextPreProcessor import TextPreprocessor
+
+
+class LegacyPreprocessor:
+    """The original per-tweet implementation: pattern looked up per call, no lemma cache"""
+
+    def __init__(self):
+        self.lemmatizer = WordNetLemmatizer()
+        self.stop_words = set(stopwords.words('english'))
+
+    def preprocess_text(self, text):
+        text = str(text).lower()
+        text = re.sub(r'http\S+|www\S+|https\S+|@\w+|#\w+|\d+|[^\w\s]', ' ', text)
+        tokens = text.split()
+        return ' '.join([self.lemmatizer.lemmatize(token) for token in tokens if token not in self.stop_words])
+
+
+def load_corpus(csv_file=None, size=20000):
+    """
+    Build the benchmark corpus
+
+    Args:
+        csv_file (str, optional): mypersonality_final.csv; its STATUS column is used when given
+        size (int): Number of tweets in the corpus
+
+    Returns:
+        list: Tweet texts
+    """
+    texts = list(SAMPLE_TEXTS)
+    if csv_file:
+        import pandas as pd
+        texts = pd.read_csv(csv_file, encoding='latin1')['STATUS'].astype(str).tolist()
+    return (texts * (size // len(texts) + 1))[:size]
+
+
+def tweets_per_second(fn, texts):
+    start = time.perf_counter()
+    fn(texts)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main(csv_file=None):
+    download_nltk_resources()
+    texts = load_corpus(csv_file)
+
+    # Separate instances so each run starts with a cold lemma cache
+    legacy = LegacyPreprocessor()
+    single = TextPreprocessor()
+    batched = TextPreprocessor()
+    pooled = TextPreprocessor()
+    legacy.preprocess_text('loading wordnet')  # Load WordNet outside the timed runs
+    pooled.preprocess_many(texts[:1000], parallel=True)  # Start the workers outside the timed runs
+
+    print("\n" + "=" * 50)
+    print(f"PREPROCESSING BENCHMARK ({len(texts)} tweets)".center(50))
+    print("=" * 50)
+    runs = [
+        ('legacy per-tweet', lambda batch: [legacy.preprocess_text(text) for text in batch]),
+        ('preprocess_text', lambda batch: [single.preprocess_text(text) for text in batch]),
+        ('preprocess_many', lambda batch: batched.preprocess_many(batch, parallel=False)),
+        ('preprocess_many pool', lambda batch: pooled.preprocess_many(batch, parallel=True))
+    ]
+    for label, fn in runs:
+        print(f"  {label:<20}{tweets_per_second(fn, texts):>12,.0f} tweets/sec")
+    print(f"\nLemma cache: {batched.lemma_cache_info()}")
+    pooled.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
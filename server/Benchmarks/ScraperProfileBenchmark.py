@@ -0,0 +1,129 @@
+import functools
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from Core.TweetScraper import create_driver
+
+# Resource sizes of the fixture page (bytes); roughly one screen of a media-heavy timeline
+FIXTURE_FILES = {
+    'avatar.png': 40 * 1024,
+    'media_1.jpg': 250 * 1024,
+    'media_2.jpg': 250 * 1024,
+    'media_3.webp': 180 * 1024,
+    'clip.mp4': 1024 * 1024,
+    'chirp.woff2': 90 * 1024,
+    'i/jot/client_event.js': 30 * 1024
+}
+
+
+class CountingHandler(SimpleHTTPRequestHandler):
+    """Static file handler that counts the bytes it serves"""
+
+    bytes_sent = 0
+    requests = 0
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def copyfile(self, source, outputfile):
+        data = source.read()
+        outputfile.write(data)
+        with CountingHandler.lock:
+            CountingHandler.bytes_sent += len(data)
+            CountingHandler.requests += 1
+
+    @classmethod
+    def reset(cls):
+        with cls.lock:
+            cls.bytes_sent = 0
+            cls.requests = 0
+
+
+def write_fixture(directory, tweets=40):
+    """
+    Write a timeline-like fixture page with images, video, a web font and an analytics script
+
+    Args:
+        directory (str): Directory served by the HTTP server
+        tweets (int): Number of tweet articles on the page
+    """
+    for name, size in FIXTURE_FILES.items():
+        path = os.path.join(directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(os.urandom(size))
+
+    articles = []
+    for i in range(tweets):
+        media = f'<img src="media_{i % 3 + 1}.{"webp" if i % 3 == 2 else "jpg"}?name=small&amp;v={i}">'
+        if i % 10 == 0:
+            media += f'<video src="clip.mp4?v={i}" preload="auto"></video>'
+        articles.append(
+            f'<article data-testid="tweet"><img src="avatar.png?v={i}">'
+            f'<a href="/user/status/{1000 + i}">link</a>'
+            f'<div data-testid="tweetText">Fixture tweet number {i} about nothing in particular</div>'
+            f'{media}</article>'
+        )
+
+    html = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8">
+<style>@font-face {{ font-family: Chirp; src: url(chirp.woff2); }} body {{ font-family: Chirp; }}</style>
+<script src="i/jot/client_event.js"></script>
+</head><body>{''.join(articles)}</body></html>"""
+    with open(os.path.join(directory, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(html)
+
+
+def measure(driver, url, loads=5):
+    """
+    Load the fixture page several times with the cache disabled
+
+    Returns:
+        tuple: (mean load time in ms, mean bytes served per load, mean requests per load)
+    """
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': True})
+    driver.get('about:blank')
+
+    CountingHandler.reset()
+    elapsed = 0.0
+    for _ in range(loads):
+        start = time.perf_counter()
+        driver.get(url)  # Returns after the load event
+        elapsed += time.perf_counter() - start
+        driver.get('about:blank')
+    return elapsed * 1000.0 / loads, CountingHandler.bytes_sent / loads, CountingHandler.requests / loads
+
+
+def main(loads=5):
+    with tempfile.TemporaryDirectory() as directory:
+        write_fixture(directory)
+        server = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(CountingHandler, directory=directory))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/index.html"
+
+        results = []
+        try:
+            for label, lean in (('default profile', False), ('lean profile', True)):
+                driver = create_driver(headless=True, lean=lean)
+                try:
+                    results.append((label,) + measure(driver, url, loads))
+                finally:
+                    driver.quit()
+        finally:
+            server.shutdown()
+
+    print("\n" + "=" * 60)
+    print(f"SCRAPER PROFILE BENCHMARK ({loads} loads each)".center(60))
+    print("=" * 60)
+    for label, load_ms, bytes_served, requests in results:
+        print(f"  {label:<18}{load_ms:>10.1f} ms {bytes_served / 1024:>10.1f} KiB {requests:>6.1f} requests")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
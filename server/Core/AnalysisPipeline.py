@@ -0,0 +1,117 @@
+import queue
+import threading
+import time
+from typing import List, Optional, Dict, Any, Iterable
+
+
+class AnalysisPipeline:
+    def __init__(self, preprocessor, inference_batcher,
+                 skip_ids: Optional[Iterable[str]] = None,
+                 batch_size: int = 8,
+                 max_wait_ms: float = 50.0):
+        """
+        Preprocess and score tweets on a consumer thread while the scraper is still scrolling
+
+        Pass submit() as the scraper's on_tweet callback; tweets are scored in small batches as
+        they arrive, so by the time the last one is collected only the final batch is left.
+        analyze() then returns the results, scoring whatever the pipeline did not see (cache hits).
+
+        Args:
+            preprocessor: Loaded TextPreprocessor
+            inference_batcher: Running InferenceBatcher
+            skip_ids (iterable, optional): Status IDs that need no scoring (e.g. already in the ScoreStore)
+            batch_size (int): Tweets preprocessed and scored together
+            max_wait_ms (float): How long a partial batch waits for more tweets before it is scored
+        """
+        self.preprocessor = preprocessor
+        self.inference_batcher = inference_batcher
+        self.skip_ids = set(skip_ids or ())
+        self.batch_size = batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue = queue.Queue()
+        self._results = {}  # Raw text -> OceanAnalyzer.analyze result
+        self._worker = None
+        self.error = None
+
+        # Metrics
+        self.scored_while_scraping = 0
+        self.scored_after = 0
+        self.busy_seconds = 0.0
+
+    def start(self) -> None:
+        """Start the consumer thread"""
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name='AnalysisPipeline', daemon=True)
+            self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Score the tweets still queued and stop the consumer thread"""
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join(timeout)
+            self._worker = None
+
+    def submit(self, record: Dict[str, Any]) -> None:
+        """Queue a scraped tweet record ({'id', 'text', ...}) for scoring"""
+        if record.get('id') not in self.skip_ids and record.get('text'):
+            self._queue.put(record['text'])
+
+    def analyze(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        OCEAN results for raw texts, in order; drop-in for preprocess_many + inference_batcher.analyze
+
+        Texts scored while scraping are served from the pipeline, the rest are scored now.
+        """
+        self.stop()
+        missing = list(dict.fromkeys(text for text in texts if text not in self._results))
+        if missing:
+            self._score(missing)
+            self.scored_after += len(missing)
+        return [self._results[text] for text in texts]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'scored_while_scraping': self.scored_while_scraping,
+            'scored_after': self.scored_after,
+            'busy_seconds': self.busy_seconds,
+            'error': self.error
+        }
+
+    def _run(self) -> None:
+        batch = []
+        while True:
+            try:
+                text = self._queue.get(timeout=self.max_wait if batch else None)
+            except queue.Empty:
+                # Partial batch waited long enough; score it while the scraper scrolls on
+                self._flush(batch)
+                batch = []
+                continue
+
+            if text is None:
+                self._flush(batch)
+                return
+
+            batch.append(text)
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+
+    def _flush(self, batch: List[str]) -> None:
+        batch = [text for text in dict.fromkeys(batch) if text not in self._results]
+        if not batch or self.error:
+            return
+        try:
+            self._score(batch)
+            self.scored_while_scraping += len(batch)
+        except Exception as e:
+            # Leave the rest to analyze(), which scores on the request thread and surfaces the error
+            self.error = str(e)
+            print(f"Analysis pipeline stopped scoring: {str(e)}")
+
+    def _score(self, texts: List[str]) -> None:
+        started = time.perf_counter()
+        results = self.inference_batcher.analyze(self.preprocessor.preprocess_many(texts))
+        self.busy_seconds += time.perf_counter() - started
+        self._results.update(zip(texts, results))
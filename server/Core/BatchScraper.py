@@ -0,0 +1,118 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Any, Iterator
+
+from Core.DriverPool import DriverPool, DriverPoolExhausted
+
+
+def is_profile_url(identifier: str) -> bool:
+    return 'twitter.com/' in identifier or identifier.startswith(('http://', 'https://'))
+
+
+def _failed_result(identifier: str, **fields) -> Dict[str, Any]:
+    result = {
+        'identifier': identifier,
+        'username': None,
+        'status': 'failed',
+        'tweets': [],
+        'count': 0,
+        'seconds': 0.0,
+        'wait_seconds': 0.0,
+        'scrape_stats': None,
+        'error': None
+    }
+    result.update(fields)
+    return result
+
+
+def scrape_profile(pool: DriverPool, identifier: str, num_tweets: int) -> Dict[str, Any]:
+    """
+    Scrape one profile with a pooled driver
+
+    Args:
+        pool (DriverPool): Pool to borrow the driver from
+        identifier (str): Username or profile URL
+        num_tweets (int): Number of tweets to retrieve
+
+    Returns:
+        dict: identifier, username, status ('ok', 'protected', 'missing' or 'failed'), tweets, count,
+              seconds (total), wait_seconds (driver checkout), scrape_stats and error
+    """
+    started = time.perf_counter()
+    is_url = is_profile_url(identifier)
+    result = _failed_result(identifier)
+
+    try:
+        with pool.scraper() as scraper:
+            result['wait_seconds'] = time.perf_counter() - started
+            result['username'] = scraper.extract_username_from_url(identifier) if is_url else identifier
+
+            tweets = scraper.scrape_tweets(identifier, is_url=is_url, num_tweets=num_tweets)
+            result['scrape_stats'] = dict(scraper.last_scrape_stats)
+
+            if tweets is None:
+                missing = scraper.last_scrape_stats.get('profile_state') == 'missing'
+                result['status'] = 'missing' if missing else 'protected'
+                result['error'] = "Profile does not exist or is suspended" if missing else "Profile is private"
+            else:
+                result.update(status='ok', tweets=tweets, count=len(tweets))
+    except DriverPoolExhausted as e:
+        result['wait_seconds'] = time.perf_counter() - started
+        result['error'] = f"No browser available: {str(e)}"
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {str(e)}"
+
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def _scrape_batch_profile(pool: DriverPool, identifier: str, num_tweets: int) -> Dict[str, Any]:
+    """scrape_profile within the pool's batch slots, so batches never hold every driver"""
+    started = time.perf_counter()
+    if not pool.batch_slots.acquire(timeout=pool.acquire_timeout):
+        waited = time.perf_counter() - started
+        return _failed_result(identifier, seconds=waited, wait_seconds=waited,
+                              error=f"No browser available: all {pool.batch_limit} batch slots are busy; retry later")
+    try:
+        result = scrape_profile(pool, identifier, num_tweets)
+    finally:
+        pool.batch_slots.release()
+    # Time spent waiting for a batch slot counts as driver wait
+    waited = time.perf_counter() - started - result['seconds']
+    result['wait_seconds'] += waited
+    result['seconds'] += waited
+    return result
+
+
+def scrape_profiles(pool: DriverPool,
+                    identifiers: List[str],
+                    num_tweets: int = 20,
+                    concurrency: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Scrape many profiles across the driver pool, yielding each result as soon as it completes
+
+    Failures are reported per profile (see scrape_profile) and never stop the batch. Closing
+    the generator early cancels the profiles that have not started yet.
+
+    Args:
+        pool (DriverPool): Pool to borrow drivers from
+        identifiers (list): Usernames and/or profile URLs (duplicates are scraped once)
+        num_tweets (int): Number of tweets per profile
+        concurrency (int, optional): Profiles scraped at the same time (default and maximum: the
+            pool's batch_limit, one driver less than its size, shared by all running batches)
+
+    Yields:
+        dict: One scrape_profile result per identifier, in completion order
+    """
+    identifiers = list(dict.fromkeys(identifiers))
+    if not identifiers:
+        return
+
+    workers = max(1, min(concurrency or pool.batch_limit, pool.batch_limit, len(identifiers)))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='BatchScraper')
+    try:
+        futures = [executor.submit(_scrape_batch_profile, pool, identifier, num_tweets) for identifier in identifiers]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
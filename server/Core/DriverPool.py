@@ -0,0 +1,229 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional, Dict, Any
+
+from Core.Metrics import Histogram
+from Core.TweetScraper import TwitterScraper, create_driver
+
+
+class DriverPoolExhausted(Exception):
+    """Raised when no browser frees up within the acquire timeout (callers answer 503)"""
+
+
+class _DriverEntry:
+    def __init__(self, scraper: TwitterScraper):
+        self.scraper = scraper
+        self.uses = 0
+        self.created_at = time.monotonic()
+
+
+class DriverPool:
+    def __init__(self, size: int = 2,
+                 headless: bool = True,
+                 max_uses: int = 50,
+                 acquire_timeout: float = 30.0,
+                 prewarm: int = 1,
+                 lean: bool = True,
+                 extraction_mode: str = 'script'):
+        """
+        Bounded pool of warm Chrome drivers wrapped in TwitterScrapers
+
+        Args:
+            size (int): Maximum number of Chrome processes (idle + checked out)
+            headless (bool): Whether Chrome runs headless
+            max_uses (int): Checkouts after which a driver is quit and replaced, bounding memory growth
+            acquire_timeout (float): Seconds to wait for a free driver before raising DriverPoolExhausted
+            prewarm (int): Drivers launched by prewarm() before the first request
+            lean (bool): Launch drivers with the lean profile (no images, media, fonts or analytics)
+            extraction_mode (str): TwitterScraper extraction mode; 'network' also enables the
+                performance log on every driver
+        """
+        self.size = size
+        self.headless = headless
+        self.max_uses = max_uses
+        self.acquire_timeout = acquire_timeout
+        self.prewarm_count = min(prewarm, size)
+        self.lean = lean
+        self.extraction_mode = extraction_mode
+
+        self._idle = deque()
+        self._in_use = {}
+        self._launched = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+        # Drivers batch jobs may hold at once across all batches; one is always left for interactive routes
+        self.batch_limit = max(1, size - 1)
+        self.batch_slots = threading.BoundedSemaphore(self.batch_limit)
+
+        # Metrics
+        self.wait_histogram = Histogram('driver_wait_ms', [1, 10, 100, 500, 1000, 5000, 10000, 30000])
+        self.launch_histogram = Histogram('driver_launch_ms', [250, 500, 1000, 2000, 5000, 10000])
+        self.checkouts = 0
+        self.rejected = 0
+        self.recycled = 0
+        self.failed_health_checks = 0
+
+    def _launch(self) -> _DriverEntry:
+        started = time.perf_counter()
+        driver = create_driver(self.headless, self.lean, network_capture=self.extraction_mode == 'network')
+        self.launch_histogram.observe((time.perf_counter() - started) * 1000.0)
+        return _DriverEntry(TwitterScraper(headless=self.headless, driver=driver, extraction_mode=self.extraction_mode))
+
+    def prewarm(self, background: bool = False) -> None:
+        """Launch prewarm drivers ahead of the first request"""
+        def run():
+            for _ in range(self.prewarm_count):
+                with self._cond:
+                    if self._closed or self._launched >= self.size or len(self._idle) >= self.prewarm_count:
+                        return
+                    self._launched += 1
+                try:
+                    entry = self._launch()
+                except Exception as e:
+                    self._release_slot()
+                    print(f"Failed to prewarm Chrome driver: {str(e)}")
+                    return
+                with self._cond:
+                    self._idle.append(entry)
+                    self._cond.notify()
+
+        if background:
+            threading.Thread(target=run, name='DriverPoolPrewarm', daemon=True).start()
+        else:
+            run()
+
+    def acquire(self, timeout: Optional[float] = None) -> TwitterScraper:
+        """
+        Check a scraper out, launching a new driver while below size
+
+        Raises:
+            DriverPoolExhausted: If every driver stays busy for the whole timeout
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            entry = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise DriverPoolExhausted("Driver pool is closed")
+                    if self._idle:
+                        entry = self._idle.pop()
+                        break
+                    if self._launched < self.size:
+                        self._launched += 1  # Reserve the slot; launch outside the lock
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.rejected += 1
+                        raise DriverPoolExhausted(
+                            f"All {self.size} browsers are busy; retry later")
+                    self._cond.wait(remaining)
+
+            if entry is None:
+                try:
+                    entry = self._launch()
+                except Exception:
+                    self._release_slot()
+                    raise
+            elif not self._is_healthy(entry):
+                self.failed_health_checks += 1
+                self._quit(entry)
+                continue
+
+            with self._cond:
+                entry.uses += 1
+                self._in_use[id(entry.scraper)] = entry
+                self.checkouts += 1
+            self.wait_histogram.observe((time.monotonic() - started) * 1000.0)
+            return entry.scraper
+
+    def release(self, scraper: TwitterScraper, discard: bool = False) -> None:
+        """Return a scraper; its driver is quit instead when discarded or past max_uses"""
+        with self._cond:
+            entry = self._in_use.pop(id(scraper), None)
+        if entry is None:
+            return
+
+        if not discard and entry.uses >= self.max_uses:
+            self.recycled += 1
+            discard = True
+
+        if not discard:
+            try:
+                # Drop the previous profile's page so it stops running scripts while idle
+                scraper.driver.get('about:blank')
+            except Exception:
+                discard = True
+
+        if discard or self._closed:
+            self._quit(entry)
+            return
+
+        with self._cond:
+            self._idle.append(entry)
+            self._cond.notify()
+
+    @contextmanager
+    def scraper(self, timeout: Optional[float] = None):
+        """Context manager form of acquire/release; drivers that raised are discarded"""
+        scraper = self.acquire(timeout)
+        try:
+            yield scraper
+        except Exception:
+            self.release(scraper, discard=True)
+            raise
+        else:
+            self.release(scraper)
+
+    def close(self) -> None:
+        """Quit idle drivers; checked-out drivers are quit when released"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for entry in idle:
+            self._quit(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'size': self.size,
+                'batch_limit': self.batch_limit,
+                'launched': self._launched,
+                'idle': len(self._idle),
+                'in_use': len(self._in_use),
+                'checkouts': self.checkouts,
+                'rejected': self.rejected,
+                'recycled': self.recycled,
+                'failed_health_checks': self.failed_health_checks,
+                'wait_ms': self.wait_histogram.snapshot(),
+                'launch_ms': self.launch_histogram.snapshot()
+            }
+
+    @staticmethod
+    def _is_healthy(entry: _DriverEntry) -> bool:
+        # A crashed Chrome or chromedriver fails this round-trip
+        try:
+            return entry.scraper.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _quit(self, entry: _DriverEntry) -> None:
+        try:
+            entry.scraper.driver.quit()
+        except Exception:
+            pass
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        with self._cond:
+            self._launched -= 1
+            self._cond.notify()
+
@@ -0,0 +1,183 @@
+import threading
+import numpy as np
+
+
+class InferenceBackend:
+    """Runs the OCEAN regressor over a padded [batch, max_length] int32 matrix."""
+
+    name = None
+
+    def predict(self, padded_sequences):
+        """Return an (n, 5) float32 array of OCEAN scores."""
+        raise NotImplementedError
+
+
+class KerasBackend(InferenceBackend):
+    name = 'keras'
+
+    def __init__(self, model, max_length, mode='compiled'):
+        self.model = model
+        self.max_length = max_length
+        self.mode = mode
+        self._inference_fn = None
+
+    def _build_inference_fn(self):
+        """Trace the model once with a fixed [batch, max_length] int32 signature."""
+        import tensorflow as tf
+
+        model = self.model
+
+        @tf.function(input_signature=[tf.TensorSpec(shape=[None, self.max_length], dtype=tf.int32)])
+        def infer(padded_sequences):
+            return model(padded_sequences, training=False)
+
+        return infer
+
+    def predict(self, padded_sequences):
+        if self.mode == 'predict':
+            # Full Keras predict loop (tf.data pipeline + callbacks per call)
+            return self.model.predict(padded_sequences, verbose=0)
+
+        # Every batch is padded to max_length, so a single concrete function serves all
+        # batch sizes without retracing
+        if self._inference_fn is None:
+            self._inference_fn = self._build_inference_fn()
+        predictions = self._inference_fn(np.asarray(padded_sequences, dtype=np.int32))
+        return predictions.numpy()
+
+
+class TFLiteBackend(InferenceBackend):
+    name = 'tflite'
+
+    def __init__(self, model_file, num_threads=None):
+        # Prefer the standalone runtime so workers never import TensorFlow
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            from tensorflow.lite import Interpreter
+
+        self.interpreter = Interpreter(model_path=model_file, num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        self.input_details = self.interpreter.get_input_details()[0]
+        self.output_details = self.interpreter.get_output_details()[0]
+        self.batch_size = int(self.input_details['shape'][0])
+
+        # The interpreter holds mutable tensor buffers, so calls must not overlap
+        self._lock = threading.Lock()
+
+    def predict(self, padded_sequences):
+        padded_sequences = np.asarray(padded_sequences, dtype=self.input_details['dtype'])
+
+        with self._lock:
+            if padded_sequences.shape[0] != self.batch_size:
+                self.interpreter.resize_tensor_input(self.input_details['index'], padded_sequences.shape)
+                self.interpreter.allocate_tensors()
+                self.batch_size = padded_sequences.shape[0]
+
+            self.interpreter.set_tensor(self.input_details['index'], padded_sequences)
+            self.interpreter.invoke()
+            return self.interpreter.get_tensor(self.output_details['index']).copy()
+
+
+class NumpyBackend(InferenceBackend):
+    """
+    TensorFlow-free forward pass of Embedding -> LSTM -> GlobalMaxPooling1D -> Dense(relu) -> Dense,
+    vectorized over the whole batch (only the LSTM recurrence loops, once per timestep).
+    """
+
+    name = 'numpy'
+
+    def __init__(self, weights_file):
+        with np.load(weights_file) as weights:
+            self.embedding = weights['embedding'].astype(np.float32)
+            self.lstm_kernel = weights['lstm_kernel'].astype(np.float32)
+            self.lstm_recurrent_kernel = weights['lstm_recurrent_kernel'].astype(np.float32)
+            self.lstm_bias = weights['lstm_bias'].astype(np.float32)
+            self.hidden_kernel = weights['hidden_kernel'].astype(np.float32)
+            self.hidden_bias = weights['hidden_bias'].astype(np.float32)
+            self.output_kernel = weights['output_kernel'].astype(np.float32)
+            self.output_bias = weights['output_bias'].astype(np.float32)
+        self.units = self.lstm_recurrent_kernel.shape[0]
+
+    @staticmethod
+    def _sigmoid(x):
+        return 1.0 / (1.0 + np.exp(-x))
+
+    def predict(self, padded_sequences):
+        padded_sequences = np.asarray(padded_sequences, dtype=np.int64)
+        batch_size, timesteps = padded_sequences.shape
+        units = self.units
+
+        # Input projections for every timestep in one matmul: (batch, time, 4 * units)
+        inputs = self.embedding[padded_sequences] @ self.lstm_kernel + self.lstm_bias
+
+        h = np.zeros((batch_size, units), dtype=np.float32)
+        c = np.zeros((batch_size, units), dtype=np.float32)
+        pooled = np.full((batch_size, units), -np.inf, dtype=np.float32)
+
+        for t in range(timesteps):
+            z = inputs[:, t] + h @ self.lstm_recurrent_kernel
+            # Keras gate order: input, forget, cell candidate, output
+            i = self._sigmoid(z[:, :units])
+            f = self._sigmoid(z[:, units:2 * units])
+            g = np.tanh(z[:, 2 * units:3 * units])
+            o = self._sigmoid(z[:, 3 * units:])
+            c = f * c + i * g
+            h = o * np.tanh(c)
+            np.maximum(pooled, h, out=pooled)
+
+        hidden = np.maximum(pooled @ self.hidden_kernel + self.hidden_bias, 0.0)
+        return hidden @ self.output_kernel + self.output_bias
+
+
+def export_numpy_weights(model, weights_file):
+    """Dump the trained layer weights of the OCEAN model for NumpyBackend."""
+    embedding, lstm, _, hidden, output = model.layers
+    lstm_kernel, lstm_recurrent_kernel, lstm_bias = lstm.get_weights()
+    hidden_kernel, hidden_bias = hidden.get_weights()
+    output_kernel, output_bias = output.get_weights()
+
+    with open(weights_file, 'wb') as f:
+        np.savez(
+            f,
+            embedding=embedding.get_weights()[0],
+            lstm_kernel=lstm_kernel,
+            lstm_recurrent_kernel=lstm_recurrent_kernel,
+            lstm_bias=lstm_bias,
+            hidden_kernel=hidden_kernel,
+            hidden_bias=hidden_bias,
+            output_kernel=output_kernel,
+            output_bias=output_bias
+        )
+    return weights_file
+
+
+def export_tflite(model, model_file):
+    """Convert a trained Keras model into a TFLite flatbuffer."""
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    tflite_model = converter.convert()
+    with open(model_file, 'wb') as f:
+        f.write(tflite_model)
+    return model_file
+
+
+def check_parity(reference, candidate, padded_sequences, atol=1e-4):
+    """
+    Compare two backends on the same padded batch.
+
+    Returns the largest absolute difference, raising ValueError if it exceeds atol.
+    """
+    expected = np.asarray(reference.predict(padded_sequences), dtype=np.float32)
+    actual = np.asarray(candidate.predict(padded_sequences), dtype=np.float32)
+
+    if expected.shape != actual.shape:
+        raise ValueError(f"Backend output shapes differ: {expected.shape} vs {actual.shape}")
+
+    max_diff = float(np.max(np.abs(expected - actual))) if expected.size else 0.0
+    if max_diff > atol:
+        raise ValueError(
+            f"{candidate.name} predictions differ from {reference.name} by {max_diff:.6f} (tolerance {atol})"
+        )
+    return max_diff
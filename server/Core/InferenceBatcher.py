@@ -0,0 +1,167 @@
+import queue
+import threading
+import time
+from typing import List, Dict, Any, Optional
+
+from Core.Metrics import Histogram
+
+
+class _PendingRequest:
+    """Texts submitted by a single caller plus the slot its results are scattered into"""
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.enqueued_at = time.perf_counter()
+        self.done = threading.Event()
+        self.results = None
+        self.error = None
+
+
+class InferenceBatcher:
+    def __init__(self, analyzer, max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        """
+        Coalesce concurrent OceanAnalyzer.analyze calls into shared predict batches
+
+        Args:
+            analyzer: Loaded OceanAnalyzer used to run the batched inference
+            max_batch_size (int): Maximum number of texts per predict call
+            max_wait_ms (float): Longest time the first queued request waits for others to join its batch
+        """
+        self.analyzer = analyzer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue = queue.Queue()
+        self._carry = None  # Request that did not fit in the previous batch
+        self._stopped = threading.Event()
+        self._worker = None
+        self._start_lock = threading.Lock()
+
+        # Metrics used to tune throughput vs. tail latency
+        self.batch_size_histogram = Histogram('batch_size', [1, 2, 4, 8, 16, 32, 64, 128, 256])
+        self.queue_wait_histogram = Histogram('queue_wait_ms', [0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000])
+
+    def start(self) -> None:
+        """Start the background batching thread if it is not running yet"""
+        with self._start_lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._stopped.clear()
+            self._worker = threading.Thread(target=self._run, name='InferenceBatcher', daemon=True)
+            self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the batching thread after the queued requests are served"""
+        self._stopped.set()
+        self._queue.put(None)  # Wake the worker up
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+
+    def analyze(self, texts, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Queue texts for batched inference and block until their results are ready
+
+        Args:
+            texts: A single text or a list of (preprocessed) texts
+            timeout (float, optional): Seconds to wait for the results
+
+        Returns:
+            List[Dict[str, Any]]: Same structure as OceanAnalyzer.analyze
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+        if not texts:
+            return []
+
+        self.start()
+        pending = _PendingRequest(list(texts))
+        self._queue.put(pending)
+
+        if not pending.done.wait(timeout):
+            raise TimeoutError("Timed out waiting for batched inference")
+        if pending.error is not None:
+            raise pending.error
+        return pending.results
+
+    def stats(self) -> Dict[str, Any]:
+        """Return batch-size and queue-wait histograms"""
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000.0,
+            'queue_depth': self._queue.qsize(),
+            'batch_size': self.batch_size_histogram.snapshot(),
+            'queue_wait_ms': self.queue_wait_histogram.snapshot()
+        }
+
+    def _collect_batch(self, first: _PendingRequest) -> List[_PendingRequest]:
+        """
+        Gather requests until the batch is full or the first request's deadline passes
+
+        Requests already queued are always taken, even past the deadline: under load they
+        piled up during the previous predict call, and waiting is what batching is for.
+        """
+        batch = [first]
+        size = len(first.texts)
+        deadline = first.enqueued_at + self.max_wait
+
+        while size < self.max_batch_size:
+            try:
+                pending = self._queue.get_nowait()
+            except queue.Empty:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    pending = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if pending is None:
+                # Stop requested; serve what we have and let the loop exit
+                self._queue.put(None)
+                break
+            if size + len(pending.texts) > self.max_batch_size:
+                # Would overflow this batch, so it opens the next one instead
+                self._carry = pending
+                break
+            batch.append(pending)
+            size += len(pending.texts)
+
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            if self._carry is not None:
+                first, self._carry = self._carry, None
+            else:
+                first = self._queue.get()
+            if first is None:
+                if self._stopped.is_set():
+                    return
+                continue
+
+            batch = self._collect_batch(first)
+            self._process(batch)
+
+    def _process(self, batch: List[_PendingRequest]) -> None:
+        started = time.perf_counter()
+        texts = []
+        for pending in batch:
+            self.queue_wait_histogram.observe((started - pending.enqueued_at) * 1000.0)
+            texts.extend(pending.texts)
+        self.batch_size_histogram.observe(len(texts))
+
+        try:
+            results = self.analyzer.analyze(texts)
+        except Exception as e:
+            for pending in batch:
+                pending.error = e
+                pending.done.set()
+            return
+
+        # Scatter the results back to the callers in submission order
+        offset = 0
+        for pending in batch:
+            pending.results = results[offset:offset + len(pending.texts)]
+            offset += len(pending.texts)
+            pending.done.set()
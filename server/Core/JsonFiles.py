@@ -0,0 +1,43 @@
+import json
+import os
+import re
+import tempfile
+from typing import Optional, Any
+
+
+def username_path(directory: str, username: str) -> str:
+    """JSON file of a username inside directory"""
+    # Twitter handles are [A-Za-z0-9_]; anything else is stripped so keys cannot escape the directory
+    key = re.sub(r'[^a-z0-9_]', '', username.lower()) or '_'
+    return os.path.join(directory, f"{key}.json")
+
+
+def read_json(path: str) -> Optional[Any]:
+    """Parsed file contents, or None if it is missing or unreadable"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """
+    Replace path with data, so concurrent readers never see a partial file
+
+    The temp file gets a unique name from mkstemp, which makes concurrent writers safe across
+    threads and worker processes alike; the last os.replace wins.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_file = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_file, path)
+    except BaseException:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,85 @@
+import bisect
+import threading
+from typing import Dict, List, Optional, Any
+
+
+class Histogram:
+    def __init__(self, name: str, buckets: List[float]):
+        """
+        Thread-safe cumulative histogram with fixed bucket upper bounds
+
+        Args:
+            name (str): Metric name used when reporting
+            buckets (List[float]): Sorted bucket upper bounds; an implicit +Inf bucket is added
+        """
+        self.name = name
+        self.buckets = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._max = None
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record a single observation"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+            if self._max is None or value > self._max:
+                self._max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile from the bucket counts
+
+        Args:
+            q (float): Quantile between 0 and 1 (e.g. 0.99 for p99)
+
+        Returns:
+            Optional[float]: Upper bound of the bucket holding the quantile, None if empty
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            max_value = self._max
+
+        if not total:
+            return None
+
+        rank = q * total
+        running = 0
+        for index, count in enumerate(counts):
+            running += count
+            if running >= rank:
+                return self.buckets[index] if index < len(self.buckets) else max_value
+        return max_value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON serializable view of the histogram"""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            total_sum = self._sum
+            max_value = self._max
+
+        labels = [str(bound) for bound in self.buckets] + ['+Inf']
+        return {
+            'name': self.name,
+            'count': total,
+            'sum': total_sum,
+            'mean': total_sum / total if total else None,
+            'max': max_value,
+            'p50': self.quantile(0.5),
+            'p99': self.quantile(0.99),
+            'buckets': dict(zip(labels, counts))
+        }
+
+    def reset(self) -> None:
+        """Clear all recorded observations"""
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._sum = 0.0
+            self._count = 0
+            self._max = None
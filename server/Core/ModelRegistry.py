@@ -0,0 +1,132 @@
+import os
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+from Core.NLTKResources import download_nltk_resources
+from Core.OCEANAnalyzer import OceanAnalyzer
+from Core.TextPreProcessor import TextPreprocessor
+from Core.InferenceBatcher import InferenceBatcher
+
+ModelComponents = namedtuple('ModelComponents', ['preprocessor', 'ocean_analyzer', 'inference_batcher'])
+
+
+class ModelRegistry:
+    def __init__(self, backend: str = 'keras', data_file: str = 'mypersonality_final.csv',
+                 lock_file: str = '../ocean_model.lock', stale_lock_seconds: float = 2 * 60 * 60,
+                 max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        """
+        Process-wide, once-only owner of the preprocessor, OCEAN analyzer and inference batcher
+
+        Args:
+            backend (str): OceanAnalyzer inference backend ('keras', 'tflite' or 'numpy')
+            data_file (str): Training dataset used when no saved model exists
+            lock_file (str): File lock that stops several worker processes from training at once
+            stale_lock_seconds (float): Age after which a leftover lock file is considered abandoned
+            max_batch_size (int): InferenceBatcher maximum number of texts per predict call
+            max_wait_ms (float): InferenceBatcher wait for other requests to join a batch
+        """
+        self.backend = backend
+        self.data_file = data_file
+        self.lock_file = lock_file
+        self.stale_lock_seconds = stale_lock_seconds
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        self._components = None
+        self._lock = threading.Lock()
+
+        self.error = None
+        self.load_seconds = None
+
+    @property
+    def ready(self) -> bool:
+        return self._components is not None
+
+    def get(self) -> ModelComponents:
+        """
+        Return the loaded components, loading them on first use
+
+        Double-checked locking: once loaded this is a plain attribute read, and concurrent
+        first callers wait for the single in-flight load instead of starting their own.
+        """
+        components = self._components
+        if components is not None:
+            return components
+
+        with self._lock:
+            if self._components is None:
+                started = time.perf_counter()
+                try:
+                    self._components = self._load()
+                except Exception as e:
+                    self.error = str(e)
+                    raise
+                self.error = None
+                self.load_seconds = time.perf_counter() - started
+            return self._components
+
+    def warm_up(self) -> ModelComponents:
+        """Load the components and run a dummy inference so the inference graph is traced"""
+        components = self.get()
+        components.inference_batcher.analyze([components.preprocessor.preprocess_text("Warming up the OCEAN model")])
+        return components
+
+    def _load(self) -> ModelComponents:
+        # Download NLTK resources
+        download_nltk_resources()
+
+        # Initialize the text preprocessor
+        preprocessor = TextPreprocessor()
+
+        # Initialize the OCEAN analyzer
+        ocean_analyzer = OceanAnalyzer(preprocessor, backend=self.backend)
+
+        # Try to load existing model first; exporting missing runtime files waits for the lock
+        if ocean_analyzer.load_model(export_missing=False):
+            print("Using pre-trained OCEAN model")
+        else:
+            with self._training_lock():
+                # Another worker may have finished training or exporting while we waited for the lock
+                if ocean_analyzer.load_model():
+                    print("Using OCEAN model trained by another worker")
+                else:
+                    print("OCEAN model not found. Training new model...")
+                    ocean_df = ocean_analyzer.load_data(self.data_file)
+                    X_train, X_test, y_train, y_test = ocean_analyzer.prepare_data(ocean_df)
+                    ocean_analyzer.train(X_train, y_train, X_test, y_test)
+
+        # Coalesce concurrent analysis requests into shared predict batches
+        inference_batcher = InferenceBatcher(ocean_analyzer, max_batch_size=self.max_batch_size,
+                                             max_wait_ms=self.max_wait_ms)
+        inference_batcher.start()
+
+        return ModelComponents(preprocessor, ocean_analyzer, inference_batcher)
+
+    @contextmanager
+    def _training_lock(self, poll_interval: float = 1.0):
+        """Cross-process lock file (O_EXCL create) held while training the model"""
+        while True:
+            try:
+                fd = os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.lock_file) > self.stale_lock_seconds:
+                        print("Removing stale OCEAN training lock")
+                        os.remove(self.lock_file)
+                        continue
+                except FileNotFoundError:
+                    continue
+                time.sleep(poll_interval)
+
+        try:
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            yield
+        finally:
+            try:
+                os.remove(self.lock_file)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,96 @@
+import argparse
+import os
+import nltk
+
+# NLTK package name -> resource path checked with nltk.data.find
+RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+    'omw-1.4': 'corpora/omw-1.4'
+}
+
+
+def _use_data_dir(data_dir):
+    """Search data_dir before NLTK's default locations."""
+    if data_dir and data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
+
+
+def is_resource_available(resource):
+    try:
+        nltk.data.find(RESOURCES[resource])
+        return True
+    except LookupError:
+        return False
+
+
+def missing_nltk_resources(data_dir=None):
+    _use_data_dir(data_dir)
+    return [resource for resource in RESOURCES if not is_resource_available(resource)]
+
+
+def download_nltk_resources(data_dir=None, offline=None):
+    """
+    Make the NLTK resources available, touching the network only for those missing on disk.
+
+    data_dir defaults to $NLTK_DATA_DIR (a pre-baked bundle); offline defaults to $NLTK_OFFLINE
+    and never downloads, which is what air-gapped nodes need.
+    """
+    data_dir = data_dir or os.environ.get('NLTK_DATA_DIR')
+    if offline is None:
+        offline = os.environ.get('NLTK_OFFLINE', '').lower() in ('1', 'true', 'yes')
+
+    try:
+        missing = missing_nltk_resources(data_dir)
+        if not missing:
+            return []
+
+        if offline:
+            print(f"NLTK resources missing in offline mode: {', '.join(missing)}")
+            return missing
+
+        for resource in missing:
+            nltk.download(resource, download_dir=data_dir, quiet=True)
+            print(f"Successfully downloaded {resource}")
+        return missing_nltk_resources(data_dir)
+    except Exception as e:
+        print(f"Error downloading NLTK resources: {str(e)}")
+        return list(RESOURCES)
+
+
+def bake_nltk_resources(target_dir):
+    """Download every resource into target_dir so it can be shipped to offline workers."""
+    os.makedirs(target_dir, exist_ok=True)
+    for resource in RESOURCES:
+        nltk.download(resource, download_dir=target_dir, quiet=True)
+        print(f"Baked {resource} into {target_dir}")
+
+    missing = missing_nltk_resources(target_dir)
+    if missing:
+        raise RuntimeError(f"Failed to bake NLTK resources: {', '.join(missing)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the NLTK resources used by PersonaInsight")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    bake = subparsers.add_parser('bake', help="Download all resources into a directory")
+    bake.add_argument('target_dir')
+
+    check = subparsers.add_parser('check', help="Report resources missing from disk (no network)")
+    check.add_argument('data_dir', nargs='?')
+
+    args = parser.parse_args()
+    if args.command == 'bake':
+        bake_nltk_resources(args.target_dir)
+    else:
+        missing = missing_nltk_resources(args.data_dir)
+        if missing:
+            print(f"Missing NLTK resources: {', '.join(missing)}")
+            raise SystemExit(1)
+        print("All NLTK resources available")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,120 @@
-import nltk
-import pandas as pd
+import hashlib
 import pickle
 import os
-from sklearn.model_selection import train_test_split
-from tensorflow.keras import layers, optimizers, preprocessing
-from tensorflow.keras.models import Sequential, load_model
-from tensorflow.keras import metrics
+import uuid
+from Core.NLTKResources import download_nltk_resources
 from Core.TextPreProcessor import TextPreprocessor
 from Core.PersonalityInterpretor import PersonalityInterpreter
+from Core.InferenceBackend import (
+    KerasBackend, TFLiteBackend, NumpyBackend, export_tflite, export_numpy_weights, check_parity
+)
+from Core.Vocabulary import Vocabulary
+
+# TensorFlow, pandas and scikit-learn are imported inside the training/Keras code paths only,
+# so a worker serving the exported runtime model never loads them.
+
+# Fixed corpus used to verify exported models against the Keras reference
+SAMPLE_TEXTS = [
+    "I absolutely love this new product! Best purchase ever!",
+    "This is the worst experience ever. Never buying again.",
+    "Just received my order and it isn't exactly what I wanted!",
+    "Terrible customer service, completely disappointed.",
+    "I prefer spending time alone with a good book rather than going to parties.",
+    "I always plan everything in advance and stick to my schedule.",
+    "I'm always thinking about new ideas and love exploring different possibilities.",
+    "I try to consider everyone's feelings before making decisions.",
+    "Sometimes I worry too much about what could go wrong in situations."
+]
 
 
-def download_nltk_resources():
-    try:
-        resources = ['punkt', 'stopwords', 'wordnet', 'omw-1.4']
-        for resource in resources:
-            nltk.download(resource, quiet=True)
-            print(f"Successfully downloaded {resource}")
-    except Exception as e:
-        print(f"Error downloading NLTK resources: {str(e)}")
+class OceanAnalyzer:
+    INFERENCE_MODES = ('compiled', 'predict')
+    BACKENDS = ('keras', 'tflite', 'numpy')
 
+    def __init__(self, preprocessor, max_length=50, inference_mode='compiled', backend='keras'):
+        if inference_mode not in self.INFERENCE_MODES:
+            raise ValueError(f"Unknown inference mode: {inference_mode}")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown inference backend: {backend}")
 
-class OceanAnalyzer:
-    def __init__(self, preprocessor, max_length=50):
         self.preprocessor = preprocessor
         self.max_length = max_length
+        self.inference_mode = inference_mode
+        self.backend_name = backend
+        self.backend = None
         self.model = None
-        self.tokenizer = preprocessing.text.Tokenizer()
+        self.tokenizer = None
+        self.vocabulary = None
         self.model_file = '../ocean_model.keras'  # Changed to .keras extension
         self.tokenizer_file = '../ocean_tokenizer.pkl'
+        self.runtime_model_file = '../ocean_model.tflite'
+        self.weights_file = '../ocean_weights.npz'
+        self.vocab_file = '../ocean_vocab.npy'
+        self._model_version = None
         self.interpreter = PersonalityInterpreter()
 
-    def save_model(self):
+    def save_model(self, export_runtime=False):
         # Save the Keras model with the newer .keras format
         self.model.save(self.model_file, save_format='keras')
-        # Save the tokenizer
+        # Save the tokenizer (kept for retraining) and the compact vocabulary used for inference
         with open(self.tokenizer_file, 'wb') as f:
             pickle.dump(self.tokenizer, f)
+        self.vocabulary.save(self.vocab_file)
         print("OCEAN model saved successfully")
 
-    def load_model(self):
-        if os.path.exists(self.model_file) and os.path.exists(self.tokenizer_file):
+        if export_runtime:
+            self.export_runtime_model()
+
+    def export_runtime_model(self, atol=1e-4):
+        """Export the Keras model + vocabulary for TensorFlow-free serving and verify parity."""
+        export_tflite(self.model, self.runtime_model_file)
+        export_numpy_weights(self.model, self.weights_file)
+        if not os.path.exists(self.vocab_file):
+            self.vocabulary.save(self.vocab_file)
+
+        # The exported models must reproduce Keras predictions on the fixed corpus
+        padded_sequences = self.vocabulary.texts_to_padded(SAMPLE_TEXTS, self.max_length)
+        reference = KerasBackend(self.model, self.max_length, mode=self.inference_mode)
+        deviations = {}
+        for candidate in (TFLiteBackend(self.runtime_model_file), NumpyBackend(self.weights_file)):
+            deviations[candidate.name] = check_parity(reference, candidate, padded_sequences, atol=atol)
+            print(f"OCEAN {candidate.name} model exported (max deviation from Keras: "
+                  f"{deviations[candidate.name]:.2e})")
+        return deviations
+
+    def load_model(self, export_missing=True):
+        """
+        Load the saved model for the configured backend
+
+        A runtime backend whose exported files are missing is exported from the saved Keras
+        model first (when export_missing is set); if that fails the Keras model is served and
+        backend_name switches to 'keras'. Returns False when there is nothing to load.
+        """
+        if self.backend_name == 'keras':
+            loaded = self._load_keras_model()
+        elif self._runtime_files_exist():
+            loaded = self._load_runtime_model()
+        elif export_missing and self._load_keras_model():
+            print(f"OCEAN {self.backend_name} model not found; exporting it from the Keras model...")
+            self._switch_to_runtime_model()
+            loaded = True
+        else:
+            loaded = False
+
+        if loaded:
+            self._record_model_version()
+        return loaded
+
+    def _load_keras_model(self):
+        has_vocabulary = os.path.exists(self.vocab_file) or os.path.exists(self.tokenizer_file)
+        if os.path.exists(self.model_file) and has_vocabulary:
             try:
+                from tensorflow.keras.models import load_model
+
                 # Load the Keras model
                 self.model = load_model(self.model_file)
-                # Load the tokenizer
-                with open(self.tokenizer_file, 'rb') as f:
-                    self.tokenizer = pickle.load(f)
+                # Load the vocabulary
+                self._attach_keras_backend(self._load_vocabulary())
                 print("OCEAN model loaded successfully")
                 return True
             except Exception as e:
@@ -53,7 +122,93 @@ class OceanAnalyzer:
                 return False
         return False
 
+    def _runtime_files_exist(self):
+        model_file = self.runtime_model_file if self.backend_name == 'tflite' else self.weights_file
+        return os.path.exists(model_file) and os.path.exists(self.vocab_file)
+
+    def _switch_to_runtime_model(self):
+        """Export the in-memory Keras model and serve it with the runtime backend, falling back to Keras on failure."""
+        try:
+            self.export_runtime_model()
+        except Exception as e:
+            print(f"Error exporting OCEAN runtime model: {str(e)}")
+            # Never leave files that failed the parity check for the next start to load
+            for path in (self.runtime_model_file, self.weights_file):
+                if os.path.exists(path):
+                    os.remove(path)
+        if not self._load_runtime_model():
+            self._fall_back_to_keras()
+
+    def _fall_back_to_keras(self):
+        """Serve the in-memory Keras model, and say so in backend_name, when the runtime model is unusable."""
+        print(f"Falling back to the Keras backend instead of {self.backend_name}")
+        self.backend_name = 'keras'
+
+    def model_version(self):
+        """Backend plus a content hash of the model and vocabulary files it serves, taken when they were loaded."""
+        return self._model_version
+
+    def _record_model_version(self, saved=True):
+        if not saved:
+            # Nothing on disk describes this model; never match scores from another process
+            self._model_version = f"{self.backend_name}:unsaved-{uuid.uuid4().hex}"
+            return
+
+        if self.backend_name == 'keras':
+            model_file = self.model_file
+        else:
+            model_file = self.runtime_model_file if self.backend_name == 'tflite' else self.weights_file
+        digest = hashlib.sha256()
+        for path in (model_file, self.vocab_file):
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+        self._model_version = f"{self.backend_name}:{digest.hexdigest()[:16]}"
+
+    def _load_runtime_model(self):
+        model_file = self.runtime_model_file if self.backend_name == 'tflite' else self.weights_file
+        if os.path.exists(model_file) and os.path.exists(self.vocab_file):
+            try:
+                if self.backend_name == 'tflite':
+                    self.backend = TFLiteBackend(model_file)
+                else:
+                    self.backend = NumpyBackend(model_file)
+                self.vocabulary = self._load_vocabulary()
+                print("OCEAN runtime model loaded successfully")
+                return True
+            except Exception as e:
+                print(f"Error loading OCEAN runtime model: {str(e)}")
+                return False
+        return False
+
+    def _load_vocabulary(self):
+        """Memory-map the compact vocabulary, converting the pickled Tokenizer once if it is missing, stale or in an old format."""
+        vocab_is_current = os.path.exists(self.vocab_file) and (
+            not os.path.exists(self.tokenizer_file)
+            or os.path.getmtime(self.vocab_file) >= os.path.getmtime(self.tokenizer_file)
+        )
+        if vocab_is_current:
+            try:
+                return Vocabulary.load(self.vocab_file)
+            except ValueError as e:
+                if not os.path.exists(self.tokenizer_file):
+                    raise
+                print(str(e))
+
+        print("Converting OCEAN tokenizer to the compact vocabulary format...")
+        with open(self.tokenizer_file, 'rb') as f:
+            tokenizer = pickle.load(f)
+        Vocabulary.from_keras_tokenizer(tokenizer).save(self.vocab_file)
+        return Vocabulary.load(self.vocab_file)
+
+    def _attach_keras_backend(self, vocabulary=None):
+        self.backend = KerasBackend(self.model, self.max_length, mode=self.inference_mode)
+        self.vocabulary = vocabulary or Vocabulary.from_keras_tokenizer(self.tokenizer)
+
     def build_model(self, vocab_size):
+        from tensorflow.keras import layers, optimizers, metrics
+        from tensorflow.keras.models import Sequential
+
         model = Sequential([
             layers.Embedding(vocab_size, 50, input_length=self.max_length),
             layers.LSTM(64, return_sequences=True),
@@ -69,6 +224,8 @@ class OceanAnalyzer:
         return model
 
     def load_data(self, filepath):
+        import pandas as pd
+
         print("Loading OCEAN dataset...")
         encodings = ['utf-8', 'iso-8859-1', 'cp1252', 'latin1']
 
@@ -83,9 +240,14 @@ class OceanAnalyzer:
         raise Exception("Failed to load OCEAN dataset with any encoding.")
 
     def prepare_data(self, df):
+        from sklearn.model_selection import train_test_split
+        from tensorflow.keras import preprocessing
+
         sentences = df['STATUS'].values
         labels = df[['sEXT', 'sNEU', 'sAGR', 'sCON', 'sOPN']].values
 
+        if self.tokenizer is None:
+            self.tokenizer = preprocessing.text.Tokenizer()
         self.tokenizer.fit_on_texts(sentences)
         X = self.tokenizer.texts_to_sequences(sentences)
         X = preprocessing.sequence.pad_sequences(X, maxlen=self.max_length)
@@ -105,19 +267,28 @@ class OceanAnalyzer:
             verbose=1
         )
         print("OCEAN training completed")
+        self._attach_keras_backend()
         if save_model:
             self.save_model()
+        if self.backend_name != 'keras':
+            # Runtime backends load the exported files, so later starts need no retraining
+            if save_model:
+                self._switch_to_runtime_model()
+            else:
+                self._fall_back_to_keras()
+        self._record_model_version(saved=save_model)
         return history
 
+    def predict_scores(self, padded_sequences):
+        """Run the active backend over a padded batch and return an (n, 5) array of OCEAN scores."""
+        return self.backend.predict(padded_sequences)
+
     def analyze(self, texts):
         if isinstance(texts, str):
             texts = [texts]
 
-        sequences = self.tokenizer.texts_to_sequences(texts)
-        padded_sequences = preprocessing.sequence.pad_sequences(
-            sequences, maxlen=self.max_length
-        )
-        predictions = self.model.predict(padded_sequences, verbose=0)
+        padded_sequences = self.vocabulary.texts_to_padded(texts, self.max_length)
+        predictions = self.predict_scores(padded_sequences)
 
         results = []
         for text, pred in zip(texts, predictions):
@@ -171,7 +342,7 @@ class OceanAnalyzer:
         return summary
 
 
-def main():
+def main(export_runtime=False):
     preprocessor = TextPreprocessor()
     ocean_analyzer = OceanAnalyzer(preprocessor)
 
@@ -187,21 +358,12 @@ def main():
         else:
             print("Using pre-trained OCEAN model")
 
-        # Test analysis with more diverse text samples
-        test_texts = [
-            "I absolutely love this new product! Best purchase ever!",
-            "This is the worst experience ever. Never buying again.",
-            "Just received my order and it isn't exactly what I wanted!",
-            "Terrible customer service, completely disappointed.",
-            "I prefer spending time alone with a good book rather than going to parties.",
-            "I always plan everything in advance and stick to my schedule.",
-            "I'm always thinking about new ideas and love exploring different possibilities.",
-            "I try to consider everyone's feelings before making decisions.",
-            "Sometimes I worry too much about what could go wrong in situations."
-        ]
+        if export_runtime:
+            # Write ocean_model.tflite, ocean_weights.npz and ocean_vocab.npy and check them against Keras
+            ocean_analyzer.export_runtime_model()
 
         print("\nAnalyzing text samples...")
-        results = ocean_analyzer.analyze(test_texts)
+        results = ocean_analyzer.analyze(SAMPLE_TEXTS)
 
         # Print individual results
         print("\nIndividual Analysis Results:")
@@ -234,5 +396,7 @@ def main():
 
 
 if __name__ == "__main__":
+    import sys
+
     download_nltk_resources()
-    main()
\ No newline at end of file
+    main(export_runtime='--export-runtime' in sys.argv)
\ No newline at end of file
@@ -0,0 +1,116 @@
+from typing import List, Optional, Dict, Any, Callable, Tuple
+
+from Core.JsonFiles import username_path, read_json, write_json_atomic
+
+TRAITS = ('extraversion', 'neuroticism', 'agreeableness', 'conscientiousness', 'openness')
+
+
+def _is_status_id(tweet_id: Optional[str]) -> bool:
+    # The scraper falls back to text prefixes or random keys when a tweet has no status link;
+    # those neither identify a tweet across scrapes nor sort by age, so they are never stored
+    return bool(tweet_id) and tweet_id.isdigit()
+
+
+class ScoreStore:
+    def __init__(self, store_dir: str = '../score_store', max_tweets: int = 2000):
+        """
+        Disk-backed per-tweet OCEAN scores, one JSON file per username keyed by status ID
+
+        Re-analysing a profile only preprocesses and scores tweets whose IDs are not stored
+        yet; everything else is read back. Entries scored by another model version are dropped.
+        Only numeric status IDs are stored, which lets eviction keep the newest tweets by ID.
+
+        Args:
+            store_dir (str): Directory holding the score files
+            max_tweets (int): Newest tweets (highest status IDs) kept per username
+        """
+        self.store_dir = store_dir
+        self.max_tweets = max_tweets
+
+        self.reused = 0
+        self.scored = 0
+
+    def _path(self, username: str) -> str:
+        return username_path(self.store_dir, username)
+
+    def load(self, username: str, model_version: str) -> Dict[str, Any]:
+        """
+        Stored scores of a username
+
+        Returns:
+            dict: {status ID: {'text': preprocessed text, 'scores': [5 floats in TRAITS order]}};
+                  empty if nothing (readable) is stored for this model version
+        """
+        entry = read_json(self._path(username))
+        if not entry or entry.get('model_version') != model_version:
+            return {}
+        # Files written before only status IDs were stored may still hold fallback keys
+        return {tweet_id: tweet for tweet_id, tweet in entry.get('tweets', {}).items() if _is_status_id(tweet_id)}
+
+    def save(self, username: str, model_version: str, tweets: Dict[str, Dict[str, Any]]) -> None:
+        if len(tweets) > self.max_tweets:
+            newest = sorted(tweets, key=lambda tweet_id: (len(tweet_id), tweet_id), reverse=True)[:self.max_tweets]
+            tweets = {tweet_id: tweets[tweet_id] for tweet_id in newest}
+        entry = {
+            'username': username,
+            'model_version': model_version,
+            'tweets': tweets
+        }
+        write_json_atomic(self._path(username), entry)
+
+    def score(self, username: str,
+              records: List[Dict[str, Any]],
+              analyze: Callable[[List[str]], List[Dict[str, Any]]],
+              model_version: str) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, float]], int]:
+        """
+        OCEAN results for a profile's tweets, scoring only the ones not stored yet
+
+        Args:
+            username (str): Profile the tweets belong to
+            records (list): [{'id', 'text', ...}, ...] as returned by TimelineCache.get_tweets; records
+                            without a numeric status ID are scored every time
+            analyze (callable): Preprocesses and scores raw texts, returning OceanAnalyzer.analyze results
+            model_version (str): OceanAnalyzer.model_version() of the model behind analyze
+
+        Returns:
+            tuple: (results in record order, average scores over all records or None, number of
+                   tweets that had to be scored)
+        """
+        stored = self.load(username, model_version)
+
+        unseen = [record for record in records if not _is_status_id(record.get('id')) or record['id'] not in stored]
+        new_results = {}
+        if unseen:
+            for record, result in zip(unseen, analyze([record['text'] for record in unseen])):
+                new_results[id(record)] = result
+                if _is_status_id(record.get('id')):
+                    stored[record['id']] = {
+                        'text': result['text'],
+                        'scores': [result['ocean_scores'][trait] for trait in TRAITS]
+                    }
+            self.save(username, model_version, stored)
+
+        results = []
+        sums = [0.0] * len(TRAITS)
+        for record in records:
+            result = new_results.get(id(record))
+            if result is None:
+                cached = stored[record['id']]
+                result = {'text': cached['text'], 'ocean_scores': dict(zip(TRAITS, cached['scores']))}
+            for i, trait in enumerate(TRAITS):
+                sums[i] += result['ocean_scores'][trait]
+            results.append(result)
+
+        self.scored += len(unseen)
+        self.reused += len(records) - len(unseen)
+
+        if not records:
+            return results, None, 0
+        average_scores = {trait: total / len(records) for trait, total in zip(TRAITS, sums)}
+        return results, average_scores, len(unseen)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'reused': self.reused,
+            'scored': self.scored
+        }
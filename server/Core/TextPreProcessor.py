@@ -1,23 +1,119 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+import nltk
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
 import re
 
+# URLs, mentions, hashtags, digits and punctuation are replaced with spaces
+CLEANUP_PATTERN = re.compile(r'http\S+|www\S+|https\S+|@\w+|#\w+|\d+|[^\w\s]')
+
+# Per-process preprocessor used by pool workers (lemmatizer and stopwords loaded once per worker)
+_worker_preprocessor = None
+
+
+def _init_worker(lemma_cache_size, nltk_data_path):
+    global _worker_preprocessor
+    # Spawned workers do not inherit runtime changes to nltk.data.path (e.g. NLTK_DATA_DIR)
+    nltk.data.path[:] = nltk_data_path
+    _worker_preprocessor = TextPreprocessor(lemma_cache_size=lemma_cache_size, processes=1)
+
+
+def _preprocess_chunk(texts):
+    return _worker_preprocessor.preprocess_many(texts)
+
+
 class TextPreprocessor:
-    def __init__(self):
-        self.lemmatizerlemmatizer = WordNetLemmatizer()
-        self.stop_words = set(stopwords.words('english'))
+    def __init__(self, lemma_cache_size=50000, processes=None, parallel_threshold=2000, chunk_size=500):
+        self.lemmatizer = WordNetLemmatizer()
+        self.stop_words = frozenset(stopwords.words('english'))
+        # Tweets reuse a small vocabulary, so most WordNet lookups are served from the cache
+        self.lemma_cache_size = lemma_cache_size
+        self._lemmatize = lru_cache(maxsize=lemma_cache_size)(self.lemmatizer.lemmatize)
+
+        # Optional process pool for bulk jobs; below parallel_threshold texts, IPC costs more than it saves
+        self.processes = processes or os.cpu_count() or 1
+        self.parallel_threshold = parallel_threshold
+        self.chunk_size = chunk_size
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _clean_tokens(self, tokens):
+        stop_words = self.stop_words
+        lemmatize = self._lemmatize
+        return ' '.join([lemmatize(token) for token in tokens if token not in stop_words])
 
     def preprocess_text(self, text):
         try:
-            text = str(text).lower()
-            text = re.sub(r'http\S+|www\S+|https\S+|@\w+|#\w+|\d+|[^\w\s]', ' ', text)
-            tokens = text.split()
-            cleaned_tokens = [
-                self.lemmatizer.lemmatize(token)
-                for token in tokens
-                if token not in self.stop_words
-            ]
-            return ' '.join(cleaned_tokens)
+            text = CLEANUP_PATTERN.sub(' ', str(text).lower())
+            return self._clean_tokens(text.split())
         except Exception as e:
             print(f"Error preprocessing text: {str(e)}")
-            return text
\ No newline at end of file
+            return text
+
+    def preprocess_many(self, texts, parallel=None):
+        """
+        Preprocess a list of texts with one lower() and one regex pass over the whole batch.
+
+        Large batches (>= parallel_threshold) are sharded across the worker pool unless
+        parallel=False; parallel=True forces the pool.
+        """
+        if not texts:
+            return []
+
+        if parallel is None:
+            parallel = self.processes > 1 and len(texts) >= self.parallel_threshold
+        if parallel:
+            return self._preprocess_parallel(texts)
+        return self._preprocess_batch(texts)
+
+    def _preprocess_batch(self, texts):
+        try:
+            # Tweets are joined on newlines; newlines inside a tweet are only whitespace to split(),
+            # and none of the cleanup alternatives can match across one
+            joined = '\n'.join(str(text).replace('\n', ' ') for text in texts)
+            cleaned = CLEANUP_PATTERN.sub(' ', joined.lower()).split('\n')
+            return [self._clean_tokens(text.split()) for text in cleaned]
+        except Exception as e:
+            print(f"Error preprocessing batch, falling back to per-text processing: {str(e)}")
+            return [self.preprocess_text(text) for text in texts]
+
+    def _get_pool(self):
+        with self._pool_lock:
+            if self._pool is None:
+                # Spawn, never fork: the serving process already runs batcher, writer, driver pool
+                # and TensorFlow threads whose held locks a forked child would inherit
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(self.lemma_cache_size, list(nltk.data.path))
+                )
+            return self._pool
+
+    def _preprocess_parallel(self, texts):
+        texts = list(texts)
+        chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+        try:
+            results = []
+            for chunk_result in self._get_pool().map(_preprocess_chunk, chunks):
+                results.extend(chunk_result)
+            return results
+        except BrokenProcessPool as e:
+            print(f"Preprocessing pool failed, processing in-process: {str(e)}")
+            self.close()
+            return self._preprocess_batch(texts)
+
+    def close(self):
+        """Shut the worker pool down (it is recreated on the next parallel batch)."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def lemma_cache_info(self):
+        return self._lemmatize.cache_info()
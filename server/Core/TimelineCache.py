@@ -0,0 +1,131 @@
+import os
+import time
+from typing import List, Optional, Dict, Any, Tuple, Callable
+
+from Core.DriverPool import DriverPool
+from Core.JsonFiles import username_path, read_json, write_json_atomic
+from Core.TweetScraper import TwitterScraper
+
+
+class TimelineCache:
+    def __init__(self, cache_dir: str = '../timeline_cache', ttl_seconds: float = 60 * 60, max_tweets: int = 500):
+        """
+        Disk-backed cache of scraped timelines, one JSON file per username
+
+        Args:
+            cache_dir (str): Directory holding the cache files
+            ttl_seconds (float): Age after which a cached timeline is topped up by scraping again
+            max_tweets (int): Newest tweets kept per username
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_tweets = max_tweets
+
+        self.hits = 0
+        self.top_ups = 0
+        self.misses = 0
+
+    def _path(self, username: str) -> str:
+        return username_path(self.cache_dir, username)
+
+    def load(self, username: str) -> Optional[Dict[str, Any]]:
+        """
+        Cached timeline of a username
+
+        Returns:
+            dict: {'username', 'fetched_at', 'tweets': [{'id', 'text', 'created_at'}, ...]} newest
+                  first, or None if nothing (readable) is cached
+        """
+        return read_json(self._path(username))
+
+    def save(self, username: str, tweets: List[Dict[str, Any]], fetched_at: Optional[float] = None) -> None:
+        entry = {
+            'username': username,
+            'fetched_at': fetched_at or time.time(),
+            'tweets': tweets[:self.max_tweets]
+        }
+        write_json_atomic(self._path(username), entry)
+
+    def delete(self, username: str) -> None:
+        try:
+            os.remove(self._path(username))
+        except FileNotFoundError:
+            pass
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry.get('fetched_at', 0) < self.ttl_seconds
+
+    @staticmethod
+    def merge(new_tweets: List[Dict[str, Any]], cached_tweets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Newly scraped tweets first, then cached ones not scraped again"""
+        new_ids = {tweet['id'] for tweet in new_tweets}
+        return new_tweets + [tweet for tweet in cached_tweets if tweet['id'] not in new_ids]
+
+    def get_tweets(self, pool: DriverPool, identifier: str, is_url: bool, num_tweets: int,
+                   on_tweet: Optional[Callable[[Dict[str, Any]], None]] = None) -> Tuple[Optional[List[Dict[str, Any]]], str]:
+        """
+        Newest tweets of a profile, scraping only what the cache cannot serve
+
+        - Fresh entry with enough tweets: served from disk without a browser ('cache')
+        - Stale entry: scrolls only until the newest cached tweets and merges the delta ('top-up');
+          if num_tweets new tweets arrive before any cached one, they replace the cache ('scrape')
+        - Nothing cached, or too few tweets cached: full scrape ('scrape')
+
+        Args:
+            pool (DriverPool): Pool to borrow a driver from when scraping is needed
+            identifier (str): Username or URL
+            is_url (bool): Whether the identifier is a URL
+            num_tweets (int): Number of tweets to return
+            on_tweet (callable, optional): Passed to scrape_tweets; called for each newly scraped tweet
+
+        Returns:
+            tuple: ([{'id', 'text', 'created_at'}, ...] or None if the profile is private or
+                   missing, source)
+        """
+        username = TwitterScraper.extract_username_from_url(identifier) if is_url else identifier
+        entry = self.load(username)
+        cached = entry['tweets'] if entry else []
+
+        if entry and self.is_fresh(entry) and len(cached) >= num_tweets:
+            self.hits += 1
+            return cached[:num_tweets], 'cache'
+
+        # Stopping at known tweets is only safe when the cache can fill the rest of the request
+        top_up = len(cached) >= num_tweets
+        stop_at_ids = {tweet['id'] for tweet in cached} if top_up else None
+
+        fetched_at = time.time()
+        with pool.scraper() as scraper:
+            tweets = scraper.scrape_tweets(identifier, is_url=is_url, num_tweets=num_tweets,
+                                           stop_at_ids=stop_at_ids, on_tweet=on_tweet)
+            records = list(scraper.last_tweet_records)
+            timed_out = scraper.last_scrape_stats.get('profile_state') == 'timeout'
+            reached_known = scraper.last_scrape_stats.get('reached_known', False)
+
+        if tweets is None:
+            self.delete(username)
+            return None, 'scrape'
+
+        if timed_out:
+            # The page never loaded; keep the cache as it is rather than refreshing its timestamp
+            return cached[:num_tweets], 'scrape'
+
+        # Only a scrape that scrolled down to the cached tweets is contiguous with them; otherwise
+        # tweets between the two were never seen and the fresh records replace the cache
+        top_up = top_up and reached_known
+        if top_up:
+            self.top_ups += 1
+            records = self.merge(records, cached)
+        else:
+            self.misses += 1
+
+        self.save(username, records, fetched_at)
+        return records[:num_tweets], 'top-up' if top_up else 'scrape'
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'top_ups': self.top_ups,
+            'misses': self.misses
+        }
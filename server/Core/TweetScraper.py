@@ -4,42 +4,246 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+import base64
+import html
+import json
 import time
 import re
 import random
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
+
+
+# URL patterns blocked in lean sessions: media, fonts and analytics are never needed to read tweet text
+# (trailing * so query strings such as ?name=small still match)
+LEAN_BLOCKED_URLS = [
+    '*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.ico*',
+    '*.mp4*', '*.m3u8*', '*.m4s*', '*.webm*',
+    '*.woff*', '*.ttf*', '*.otf*',
+    '*pbs.twimg.com/media/*', '*video.twimg.com/*', '*abs.twimg.com/sticky/*',
+    '*/i/jot*', '*/1.1/jot/*', '*analytics.twitter.com*', '*ads-twitter.com*',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*'
+]
+
+
+def build_chrome_options(headless: bool = True, lean: bool = False,
+                         network_capture: bool = False) -> webdriver.ChromeOptions:
+    """
+    Chrome options used for scraping sessions
+
+    Args:
+        headless (bool): Whether to run Chrome in headless mode (default: True)
+        lean (bool): Disable image loading and use a smaller viewport (text-only scraping)
+        network_capture (bool): Enable the performance log so network responses can be read
+
+    Returns:
+        webdriver.ChromeOptions: Configured options
+    """
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument('--headless')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--window-size=1024,768' if lean else '--window-size=1920,1080')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+
+    if lean:
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--mute-audio')
+        options.add_argument('--autoplay-policy=user-gesture-required')
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+
+    if network_capture:
+        # DevTools Network.* events are delivered through driver.get_log('performance')
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    # Add maximized option for better visibility in interactive mode
+    if not headless:
+        options.add_argument("--start-maximized")
+    return options
+
+
+def block_urls(driver: webdriver.Chrome, patterns: Optional[List[str]] = None) -> None:
+    """
+    Block requests matching URL patterns in a Chrome session through the DevTools protocol
+
+    Args:
+        driver (webdriver.Chrome): Chrome driver
+        patterns (list, optional): Wildcard URL patterns (default: LEAN_BLOCKED_URLS)
+    """
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns or LEAN_BLOCKED_URLS})
+
+
+def create_driver(headless: bool = True, lean: bool = False, network_capture: bool = False) -> webdriver.Chrome:
+    """
+    Launch Chrome for scraping; lean sessions also block media, font and analytics requests
+
+    Args:
+        headless (bool): Whether to run Chrome in headless mode (default: True)
+        lean (bool): Use the lean browsing profile
+        network_capture (bool): Enable the performance log for extraction_mode='network'
+
+    Returns:
+        webdriver.Chrome: New driver
+    """
+    driver = webdriver.Chrome(options=build_chrome_options(headless, lean, network_capture))
+    if lean:
+        block_urls(driver)
+    return driver
+
+
+# Tweet count and page height in one round-trip; either changing means new content arrived
+CONTENT_STATE_SCRIPT = (
+    "return [document.querySelectorAll('article[data-testid=\"tweet\"]').length, "
+    "document.body.scrollHeight];"
+)
+
+# Which profile outcome has rendered, or null while the page is still loading
+PROFILE_STATE_SCRIPT = r"""
+if (document.querySelector('article[data-testid="tweet"]')) { return 'tweets'; }
+var column = document.querySelector('[data-testid="primaryColumn"]');
+var text = column ? column.innerText : '';
+if (/(Tweets|posts) are protected/.test(text)) { return 'protected'; }
+if (/account doesn.t exist|Account suspended/i.test(text)) { return 'missing'; }
+if (/hasn.t (Tweeted|posted)/i.test(text)) { return 'empty'; }
+return null;
+"""
+
+# [status_id, text] of every rendered tweet; text parts are joined like the element-based path
+EXTRACT_TWEETS_SCRIPT = r"""
+return Array.from(document.querySelectorAll('article[data-testid="tweet"]')).map(function (article) {
+    var link = article.querySelector('a[href*="/status/"]');
+    var match = link ? link.getAttribute('href').match(/\/status\/(\d+)/) : null;
+    var parts = Array.from(article.querySelectorAll('div[data-testid="tweetText"]'));
+    return [match ? match[1] : null, parts.map(function (part) { return part.innerText; }).join(' ')];
+});
+"""
+
+# Timeline API responses (GraphQL UserTweets* and the legacy REST profile timeline)
+TIMELINE_URL_PATTERN = re.compile(r'/graphql/[^/]+/(UserTweets|UserTweetsAndReplies)\b|/2/timeline/profile/')
+
+
+def parse_timeline_tweets(payload: Any) -> List[Dict[str, Any]]:
+    """
+    Extract tweets from a timeline API response
+
+    Walks the JSON for tweet objects (a 'legacy' dict holding full_text) instead of following
+    one fixed schema, so minor changes to the timeline format do not break extraction.
+    Retweets yield the original tweet, and quoted tweets are not returned separately.
+
+    Args:
+        payload: Decoded JSON response
+
+    Returns:
+        List[Dict[str, Any]]: {'id', 'text', 'created_at'} records in timeline order
+    """
+    records = []
+
+    def walk(node):
+        if isinstance(node, list):
+            for item in node:
+                walk(item)
+            return
+        if not isinstance(node, dict):
+            return
+
+        legacy = node.get('legacy')
+        if isinstance(legacy, dict) and 'full_text' in legacy:
+            retweeted = legacy.get('retweeted_status_result')
+            if retweeted:
+                walk(retweeted)
+                return
+            # Long posts keep their complete text in note_tweet
+            note = node.get('note_tweet', {}).get('note_tweet_results', {}).get('result', {})
+            records.append({
+                'id': str(node.get('rest_id') or legacy.get('id_str')),
+                'text': html.unescape(note.get('text') or legacy['full_text']),
+                'created_at': legacy.get('created_at')
+            })
+            return
+
+        for key, value in node.items():
+            if key != 'quoted_status_result':
+                walk(value)
+
+    walk(payload)
+    return records
 
 
 class TwitterScraper:
-    def __init__(self, headless: bool = True):
-        self.headless = headless
+    def __init__(self, headless: bool = True, driver: Optional[webdriver.Chrome] = None,
+                 wait_mode: str = 'adaptive', scroll_timeout: float = 4.0, poll_interval: float = 0.1,
+                 extraction_mode: str = 'script', lean: bool = False):
         """
         Initialize the scraper with Chrome options
 
         Args:
             headless (bool): Whether to run Chrome in headless mode (default: True)
+            driver (webdriver.Chrome, optional): Existing driver to reuse (e.g. from a DriverPool);
+                the scraper does not quit a driver it did not create
+            wait_mode (str): 'adaptive' waits after each scroll until new tweets arrive or the page
+                grows (up to scroll_timeout); 'sleep' uses the fixed randomized sleeps
+            scroll_timeout (float): Maximum seconds to wait for new content after a scroll
+            poll_interval (float): Seconds between DOM checks while waiting
+            extraction_mode (str): 'script' reads all visible tweets with one execute_script call
+                per scroll; 'elements' walks the tweet elements through WebDriver calls; 'network'
+                parses the timeline API responses from the performance log and falls back to
+                'script' when none are captured (needs a driver created with network_capture)
+            lean (bool): Launch Chrome with the lean profile (no images, media, fonts or analytics)
         """
-        options = webdriver.ChromeOptions()
-        if self.headless:
-            options.add_argument('--headless')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--window-size=1920,1080')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-
-        # Add maximized option for better visibility in interactive mode
-        if not headless:
-            options.add_argument("--start-maximized")
-
-        self.driver = webdriver.Chrome(options=options)
+        if wait_mode not in ('adaptive', 'sleep'):
+            raise ValueError(f"Unknown wait mode: {wait_mode}")
+        if extraction_mode not in ('script', 'elements', 'network'):
+            raise ValueError(f"Unknown extraction mode: {extraction_mode}")
+
+        self.headless = headless
+        self.wait_mode = wait_mode
+        self.scroll_timeout = scroll_timeout
+        self.poll_interval = poll_interval
+        self.extraction_mode = extraction_mode
+        self.owns_driver = driver is None
+        self.driver = driver or create_driver(headless, lean, network_capture=extraction_mode == 'network')
         self.wait = WebDriverWait(self.driver, 15)
 
         # Store previously seen tweet IDs to avoid duplicates
         self.seen_tweets = set()
 
-    def extract_username_from_url(self, url: str) -> str:
+        # {'id', 'text', 'created_at'} records of the last scrape_tweets call, in collection order
+        self.last_tweet_records = []
+
+        # Timeline responses seen in the performance log whose bodies have not finished loading
+        self._pending_responses = set()
+
+        # Known status IDs for incremental scrapes (see scrape_tweets)
+        self._stop_at_ids = set()
+        self._known_seen = 0
+
+        # Per-tweet callback of the running scrape_tweets call
+        self._on_tweet = None
+
+        # Time split of the last scrape_tweets call
+        self.last_scrape_stats = {}
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.last_scrape_stats = {
+            'wait_mode': self.wait_mode,
+            'wait_seconds': 0.0,
+            'extract_seconds': 0.0,
+            'total_seconds': 0.0,
+            'scrolls': 0,
+            'wait_timeouts': 0,
+            'profile_state': None,
+            'detect_seconds': 0.0,
+            'extraction': self.extraction_mode,
+            'network_responses': 0,
+            'reached_known': False
+        }
+
+    @staticmethod
+    def extract_username_from_url(url: str) -> str:
         """
         Extract username from Twitter profile URL
 
@@ -104,24 +308,93 @@ class TwitterScraper:
         # Last resort: use a random ID + timestamp
         return f"tweet_{time.time()}_{random.randint(1000, 9999)}"
 
+    def detect_profile_state(self, timeout: float = 15.0) -> str:
+        """
+        Wait for whichever profile outcome renders first, polling one combined condition
+
+        Args:
+            timeout (float): Maximum seconds to wait
+
+        Returns:
+            str: 'tweets', 'protected', 'missing' (suspended or nonexistent account),
+                 'empty' (no posts) or 'timeout'
+        """
+        started = time.perf_counter()
+        try:
+            state = WebDriverWait(self.driver, timeout, poll_frequency=self.poll_interval).until(
+                lambda driver: driver.execute_script(PROFILE_STATE_SCRIPT)
+            )
+        except TimeoutException:
+            state = 'timeout'
+
+        self.last_scrape_stats['profile_state'] = state
+        self.last_scrape_stats['detect_seconds'] = time.perf_counter() - started
+        return state
+
     def perform_scroll(self, distance=None):
         """
         Perform a scrolling action with various strategies
 
         Args:
             distance (int, optional): Specific scroll distance. If None, scrolls to bottom.
+
+        Returns:
+            bool: Whether new content appeared (always True in 'sleep' mode)
         """
+        started = time.perf_counter()
+        self.last_scrape_stats['scrolls'] += 1
+
+        if self.wait_mode == 'sleep':
+            self._scroll(distance)
+            # Add a small random delay to mimic human behavior and give time for content to load
+            time.sleep(1 + random.random())
+            self.last_scrape_stats['wait_seconds'] += time.perf_counter() - started
+            return True
+
+        before = self.driver.execute_script(CONTENT_STATE_SCRIPT)
+        self._scroll(distance)
+        changed = self.wait_for_new_content(before)
+        self.last_scrape_stats['wait_seconds'] += time.perf_counter() - started
+        return changed
+
+    def _wait(self, seconds: float) -> None:
+        """Fixed sleep, counted in last_scrape_stats['wait_seconds'] like the adaptive waits"""
+        started = time.perf_counter()
+        time.sleep(seconds)
+        self.last_scrape_stats['wait_seconds'] += time.perf_counter() - started
+
+    def _scroll(self, distance=None):
         if distance:
             self.driver.execute_script(f"window.scrollBy(0, {distance});")
         else:
             # Full scroll to bottom
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
 
-        # Add a small random delay to mimic human behavior and give time for content to load
-        time.sleep(1 + random.random())
+    def wait_for_new_content(self, before, timeout: Optional[float] = None) -> bool:
+        """
+        Poll until the tweet count or page height differs from before
 
-    def scrape_tweets(self, identifier: str, is_url: bool, num_tweets: int, verbose: bool = False) -> Optional[
-        List[str]]:
+        Args:
+            before (list): [tweet count, scrollHeight] captured before scrolling
+            timeout (float, optional): Maximum seconds to wait (default: scroll_timeout)
+
+        Returns:
+            bool: True if new content appeared, False on timeout (after a short jitter sleep)
+        """
+        try:
+            WebDriverWait(self.driver, timeout or self.scroll_timeout, poll_frequency=self.poll_interval).until(
+                lambda driver: driver.execute_script(CONTENT_STATE_SCRIPT) != before
+            )
+            return True
+        except TimeoutException:
+            # Nothing arrived; a short random pause before the next attempt avoids a hammering rhythm
+            self.last_scrape_stats['wait_timeouts'] += 1
+            time.sleep(0.2 + 0.3 * random.random())
+            return False
+
+    def scrape_tweets(self, identifier: str, is_url: bool, num_tweets: int, verbose: bool = False,
+                      stop_at_ids: Optional[set] = None,
+                      on_tweet: Optional[Callable[[Dict[str, Any]], None]] = None) -> Optional[List[str]]:
         """
         Scrape tweets from a user's profile with improved lazy loading handling
 
@@ -130,11 +403,35 @@ class TwitterScraper:
             is_url (bool): Whether the identifier is a URL
             num_tweets (int): Number of tweets to retrieve
             verbose (bool): Whether to print progress messages
+            stop_at_ids (set, optional): Already known status IDs (e.g. cached). They are not
+                returned, and scrolling stops at the second one met (the first may be pinned)
+            on_tweet (callable, optional): Called with each {'id', 'text', 'created_at'} record as
+                soon as it is collected, e.g. to start analysing while scrolling continues
 
         Returns:
             Optional[List[str]]: List of tweets if successful, None if profile is private
         """
+        self._reset_stats()
+        self._stop_at_ids = stop_at_ids or set()
+        self._known_seen = 0
+        self._on_tweet = on_tweet
+        started = time.perf_counter()
+        try:
+            return self._scrape_tweets(identifier, is_url, num_tweets, verbose)
+        finally:
+            self._on_tweet = None
+            self.last_scrape_stats['reached_known'] = self._reached_known()
+            self.last_scrape_stats['total_seconds'] = time.perf_counter() - started
+            if verbose:
+                print(f"Scrape timing: {self.last_scrape_stats}")
+
+    def _scrape_tweets(self, identifier: str, is_url: bool, num_tweets: int, verbose: bool) -> Optional[List[str]]:
         url = self.get_profile_url(identifier, is_url)
+        extraction = self.extraction_mode
+        if extraction == 'network' and not self._start_network_capture():
+            extraction = 'script'
+        self.last_scrape_stats['extraction'] = extraction
+
         if verbose:
             print(f"\nOpening Twitter profile: {url}")
         self.driver.get(url)
@@ -142,25 +439,18 @@ class TwitterScraper:
         # Initialize wait and scroll variables
         self.wait = WebDriverWait(self.driver, 15)
 
-        try:
-            # Check if profile is private
-            private_element = self.wait.until(
-                EC.presence_of_element_located((By.XPATH, '//span[contains(text(), "These Tweets are protected")]'))
-            )
-            if private_element:
-                if verbose:
-                    print(f"Profile {identifier} is private.")
-                return None
-        except TimeoutException:
-            pass  # Profile is not private
+        # Race the possible outcomes instead of waiting out the protected-banner timeout
+        state = self.detect_profile_state()
+        if state in ('protected', 'missing'):
+            if verbose:
+                print(f"Profile {identifier} is {'private' if state == 'protected' else 'unavailable'}.")
+            return None
 
         tweets = []
         self.seen_tweets = set()  # Reset seen tweets set
+        self.last_tweet_records = []
 
-        # Wait for initial tweets to load
-        try:
-            self.wait.until(EC.presence_of_element_located((By.XPATH, '//article[@data-testid="tweet"]')))
-        except TimeoutException:
+        if state != 'tweets':
             if verbose:
                 print("No tweets found on profile or page loading issue.")
             return []
@@ -171,49 +461,38 @@ class TwitterScraper:
         max_no_new_tweets = 5  # Max number of scrolls without new tweets before trying alternative strategies
         max_scroll_attempts = 40  # Increased from 30 to 40
         scroll_count = 0
+        idle_scrolls = 0  # Consecutive adaptive scrolls that loaded nothing
+        max_idle_scrolls = 3  # End of the timeline reached
 
         # Main scroll and collect loop
-        while len(tweets) < num_tweets and scroll_count < max_scroll_attempts:
+        while len(tweets) < num_tweets and scroll_count < max_scroll_attempts and not self._reached_known():
             scroll_count += 1
 
             if verbose and scroll_count % 5 == 0:
                 print(f"Scroll attempt {scroll_count}/{max_scroll_attempts}. Collected {len(tweets)} tweets so far.")
 
-            # Find all visible tweet elements
+            # Collect the visible tweets
+            extract_started = time.perf_counter()
+            tweets_before = len(tweets)
             try:
-                tweet_elements = self.driver.find_elements(By.XPATH, '//article[@data-testid="tweet"]')
-
-                tweets_before = len(tweets)
-
-                # Process any new tweets
-                for tweet in tweet_elements:
-                    try:
-                        # Generate a unique ID for this tweet
-                        tweet_id = self.get_tweet_id(tweet)
-
-                        # Skip if we've already processed this tweet
-                        if tweet_id in self.seen_tweets:
-                            continue
-
-                        # Mark as seen
-                        self.seen_tweets.add(tweet_id)
-
-                        # Get tweet text (handling multi-part tweets)
-                        tweet_text_parts = tweet.find_elements(By.XPATH, './/div[@data-testid="tweetText"]')
-                        full_text = ' '.join([part.text for part in tweet_text_parts])
-
-                        if full_text:  # Only add if we got text
-                            tweets.append(full_text)
-                            if verbose and len(tweets) % 5 == 0:
-                                print(f"Collected tweet {len(tweets)}/{num_tweets}")
-                            if len(tweets) >= num_tweets:
-                                break
-                    except (NoSuchElementException, StaleElementReferenceException):
-                        continue
+                if extraction == 'network':
+                    if not self._collect_from_network(tweets, num_tweets, verbose) and scroll_count == 1:
+                        # No timeline response captured with the first page: read the DOM instead
+                        if verbose:
+                            print("No timeline responses captured; falling back to DOM extraction.")
+                        extraction = 'script'
+                        self.last_scrape_stats['extraction'] = extraction
+                        self._collect_with_script(tweets, num_tweets, verbose)
+                elif extraction == 'script':
+                    self._collect_with_script(tweets, num_tweets, verbose)
+                else:
+                    self._collect_with_elements(tweets, num_tweets, verbose)
             except StaleElementReferenceException:
                 # Page probably refreshed or structure changed, wait a moment
                 time.sleep(1)
                 continue
+            finally:
+                self.last_scrape_stats['extract_seconds'] += time.perf_counter() - extract_started
 
             # Check if we got any new tweets in this iteration
             if len(tweets) == tweets_before:
@@ -221,8 +500,10 @@ class TwitterScraper:
             else:
                 no_new_tweets_count = 0  # Reset counter when we find new tweets
 
-            # Break if we've collected enough tweets
-            if len(tweets) >= num_tweets:
+            # Break if we've collected enough tweets or reached the already known ones
+            if len(tweets) >= num_tweets or self._reached_known():
+                if verbose and self._reached_known():
+                    print("Reached previously collected tweets.")
                 break
 
             # Try different scrolling strategies based on our success
@@ -243,7 +524,7 @@ class TwitterScraper:
                         for button in show_more_buttons[:3]:  # Try up to 3 buttons
                             try:
                                 button.click()
-                                time.sleep(1)
+                                self._wait(1)
                             except:
                                 pass
                 except:
@@ -252,14 +533,23 @@ class TwitterScraper:
                 no_new_tweets_count = 0  # Reset counter after trying alternative method
             else:
                 # Regular scrolling strategy
-                self.perform_scroll()  # Scroll to bottom
-
-                # Wait for new content to load
-                time.sleep(1.5 + random.random())
+                loaded = self.perform_scroll()  # Scroll to bottom
+
+                if self.wait_mode == 'sleep':
+                    # Wait for new content to load
+                    self._wait(1.5 + random.random())
+                elif loaded:
+                    idle_scrolls = 0
+                else:
+                    idle_scrolls += 1
+                    if idle_scrolls >= max_idle_scrolls:
+                        if verbose:
+                            print("No new content after several scrolls; reached the end of the timeline.")
+                        break
 
             # Check if we've reached the end of the page
             new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
+            if new_height == last_height and self.wait_mode == 'sleep':
                 # Try a smaller scroll
                 self.perform_scroll(500)
             last_height = new_height
@@ -269,6 +559,114 @@ class TwitterScraper:
 
         return tweets[:num_tweets]  # Return only the requested number of tweets
 
+    def _add_tweet(self, tweet_id: str, text: str, tweets: List[str], num_tweets: int, verbose: bool,
+                   created_at: Optional[str] = None) -> bool:
+        """Record a tweet unless already seen; returns True once collection should stop"""
+        # Skip if we've already processed this tweet
+        if tweet_id in self.seen_tweets:
+            return False
+
+        # Mark as seen
+        self.seen_tweets.add(tweet_id)
+
+        if tweet_id in self._stop_at_ids:
+            self._known_seen += 1
+            return self._reached_known()
+
+        if text:  # Only add if we got text
+            tweets.append(text)
+            record = {'id': tweet_id, 'text': text, 'created_at': created_at}
+            self.last_tweet_records.append(record)
+            if self._on_tweet is not None:
+                self._on_tweet(record)
+            if verbose and len(tweets) % 5 == 0:
+                print(f"Collected tweet {len(tweets)}/{num_tweets}")
+        return len(tweets) >= num_tweets
+
+    def _reached_known(self) -> bool:
+        return self._known_seen >= 2
+
+    def _start_network_capture(self) -> bool:
+        """Discard performance log entries from earlier pages; False if the log is unavailable"""
+        self._pending_responses = set()
+        try:
+            self.driver.get_log('performance')
+            return True
+        except Exception:
+            # Driver launched without network_capture
+            return False
+
+    def _collect_from_network(self, tweets: List[str], num_tweets: int, verbose: bool) -> bool:
+        """
+        Add tweets from timeline API responses that finished loading since the last call
+
+        Returns:
+            bool: Whether any timeline response has been seen during this scrape
+        """
+        finished = []
+        for entry in self.driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+
+            params = message.get('params', {})
+            if message.get('method') == 'Network.responseReceived':
+                if TIMELINE_URL_PATTERN.search(params.get('response', {}).get('url', '')):
+                    self._pending_responses.add(params['requestId'])
+            elif message.get('method') == 'Network.loadingFinished' and params.get('requestId') in self._pending_responses:
+                finished.append(params['requestId'])
+
+        for request_id in finished:
+            self._pending_responses.discard(request_id)
+            try:
+                response = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                body = response['body']
+                if response.get('base64Encoded'):
+                    body = base64.b64decode(body).decode('utf-8')
+                payload = json.loads(body)
+            except Exception as e:
+                if verbose:
+                    print(f"Could not read timeline response: {e}")
+                continue
+
+            self.last_scrape_stats['network_responses'] += 1
+            for record in parse_timeline_tweets(payload):
+                if self._add_tweet(record['id'], record['text'], tweets, num_tweets, verbose, record['created_at']):
+                    return True
+
+        return self.last_scrape_stats['network_responses'] > 0 or bool(self._pending_responses)
+
+    def _collect_with_script(self, tweets: List[str], num_tweets: int, verbose: bool) -> None:
+        """Read [status_id, text] for every visible tweet with a single execute_script call"""
+        for status_id, text in self.driver.execute_script(EXTRACT_TWEETS_SCRIPT) or []:
+            # Same fallback as get_tweet_id when the status link is missing
+            tweet_id = status_id or text[:50] or f"tweet_{time.time()}_{random.randint(1000, 9999)}"
+            if self._add_tweet(tweet_id, text, tweets, num_tweets, verbose):
+                break
+
+    def _collect_with_elements(self, tweets: List[str], num_tweets: int, verbose: bool) -> None:
+        """Read the visible tweets element by element (several WebDriver round-trips per tweet)"""
+        # Find all visible tweet elements
+        tweet_elements = self.driver.find_elements(By.XPATH, '//article[@data-testid="tweet"]')
+
+        # Process any new tweets
+        for tweet in tweet_elements:
+            try:
+                # Generate a unique ID for this tweet
+                tweet_id = self.get_tweet_id(tweet)
+                if tweet_id in self.seen_tweets:
+                    continue
+
+                # Get tweet text (handling multi-part tweets)
+                tweet_text_parts = tweet.find_elements(By.XPATH, './/div[@data-testid="tweetText"]')
+                full_text = ' '.join([part.text for part in tweet_text_parts])
+
+                if self._add_tweet(tweet_id, full_text, tweets, num_tweets, verbose):
+                    break
+            except (NoSuchElementException, StaleElementReferenceException):
+                continue
+
     def scrape_profile_info(self, identifier: str, is_url: bool) -> Optional[Dict[str, Any]]:
         """
         Scrape basic profile information
@@ -347,14 +745,15 @@ class TwitterScraper:
 
     def close(self, delay: int = 0):
         """
-        Close the browser
+        Close the browser (pooled drivers are left to their pool)
 
         Args:
             delay (int): Delay in seconds before closing (useful for interactive mode)
         """
         if delay > 0:
             time.sleep(delay)
-        self.driver.quit()
+        if self.owns_driver:
+            self.driver.quit()
 
 
 def get_user_input():
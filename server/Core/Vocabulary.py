@@ -0,0 +1,137 @@
+import hashlib
+import os
+import numpy as np
+
+
+def word_key(encoded):
+    """64-bit BLAKE2b key of a UTF-8 encoded word."""
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), 'little')
+
+
+class Vocabulary:
+    """
+    Word -> index lookup equivalent to a fitted Keras Tokenizer (default filters, num_words=None,
+    no OOV token), stored in one memory-mapped uint8 array: the word count, a (4, n) uint64
+    table of sorted word keys, ids, offsets and lengths, then the UTF-8 words packed back to back.
+
+    Keys only narrow the search; every hit is compared with the stored word, so an unknown
+    word whose key collides with a known one is still out of vocabulary (id 0).
+
+    Only the word index is kept; the Tokenizer's word_counts, word_docs, index_docs and
+    index_word dictionaries are not needed for inference.
+    """
+
+    FILTERS = '!"#$%&()*+,-./:;<=>?@[\\]^_`{|}~\t\n'
+    SPLIT = ' '
+
+    def __init__(self, data):
+        if data.dtype != np.uint8 or data.ndim != 1:
+            # (2, n) uint64 files hold checksum keys only and cannot verify words
+            raise ValueError("Vocabulary file predates word verification; rebuild it from the tokenizer")
+        count = int(data[:8].view(np.uint64)[0])
+        table_end = 8 + 32 * count
+        self.data = data
+        self.table = data[8:table_end].view(np.uint64).reshape(4, count)
+        self.keys, self.ids, self.offsets, self.lengths = self.table
+        self.words = data[table_end:]
+        self._translate_map = str.maketrans({c: self.SPLIT for c in self.FILTERS})
+
+    @classmethod
+    def from_word_index(cls, word_index):
+        encoded = [word.encode('utf-8') for word in word_index]
+        lengths = np.fromiter((len(word) for word in encoded), dtype=np.uint64, count=len(encoded))
+        table = np.empty((4, len(encoded)), dtype=np.uint64)
+        table[0] = np.fromiter((word_key(word) for word in encoded), dtype=np.uint64, count=len(encoded))
+        table[1] = np.fromiter(word_index.values(), dtype=np.uint64, count=len(encoded))
+        table[2] = np.cumsum(lengths) - lengths
+        table[3] = lengths
+        table = table[:, np.argsort(table[0], kind='stable')]
+
+        if len(encoded) > 1 and np.any(table[0, 1:] == table[0, :-1]):
+            raise ValueError("Vocabulary key collision; words cannot be stored in the compact format")
+
+        header = np.array([len(encoded)], dtype=np.uint64)
+        data = np.concatenate([
+            header.view(np.uint8),
+            np.ascontiguousarray(table).view(np.uint8).ravel(),
+            np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        ])
+        return cls(data)
+
+    @classmethod
+    def from_keras_tokenizer(cls, tokenizer):
+        if (tokenizer.filters != cls.FILTERS or not tokenizer.lower or tokenizer.split != cls.SPLIT
+                or tokenizer.char_level or tokenizer.num_words is not None or tokenizer.oov_token is not None):
+            raise ValueError("Only Keras Tokenizers fitted with the default settings can be converted")
+        return cls.from_word_index(tokenizer.word_index)
+
+    def save(self, vocab_file):
+        # Write-then-rename so processes that have the old file mapped keep a valid view
+        temp_file = f"{vocab_file}.tmp"
+        with open(temp_file, 'wb') as f:
+            np.save(f, np.ascontiguousarray(self.data), allow_pickle=False)
+        os.replace(temp_file, vocab_file)
+
+    @classmethod
+    def load(cls, vocab_file):
+        # Memory-mapped: pages are shared between workers and loaded lazily by the OS
+        return cls(np.load(vocab_file, mmap_mode='r', allow_pickle=False))
+
+    def __len__(self):
+        return self.keys.shape[0]
+
+    def tokenize(self, text):
+        """Split text the same way keras text_to_word_sequence does."""
+        text = text.lower().translate(self._translate_map)
+        return [word for word in text.split(self.SPLIT) if word]
+
+    def lookup(self, tokens):
+        """Return int32 ids for tokens, 0 for words outside the vocabulary."""
+        if not tokens or not len(self):
+            return np.zeros(len(tokens), dtype=np.int32)
+
+        encoded = [token.encode('utf-8') for token in tokens]
+        queries = np.fromiter((word_key(token) for token in encoded), dtype=np.uint64, count=len(encoded))
+        positions = np.minimum(np.searchsorted(self.keys, queries), len(self) - 1)
+        found = self.keys[positions] == queries
+
+        # Confirm each key hit against the stored word
+        for i in np.flatnonzero(found):
+            start = int(self.offsets[positions[i]])
+            if self.words[start:start + int(self.lengths[positions[i]])].tobytes() != encoded[i]:
+                found[i] = False
+        return np.where(found, self.ids[positions], 0).astype(np.int32)
+
+    def texts_to_padded(self, texts, max_length):
+        """
+        Map texts to a pre-padded, pre-truncated int32 matrix (Keras pad_sequences defaults)
+        with one vocabulary lookup for the whole batch.
+        """
+        padded = np.zeros((len(texts), max_length), dtype=np.int32)
+        if not texts:
+            return padded
+
+        tokens = []
+        counts = np.zeros(len(texts), dtype=np.int64)
+        for row, text in enumerate(texts):
+            words = self.tokenize(text)
+            tokens.extend(words)
+            counts[row] = len(words)
+
+        ids = self.lookup(tokens)
+        rows = np.repeat(np.arange(len(texts)), counts)
+
+        # Out-of-vocabulary words are dropped, as texts_to_sequences does without an OOV token
+        known = ids > 0
+        ids, rows = ids[known], rows[known]
+        if not len(ids):
+            return padded
+
+        # Right-align each row's ids; only the last max_length survive (truncating='pre')
+        kept_counts = np.bincount(rows, minlength=len(texts))
+        row_starts = np.concatenate(([0], np.cumsum(kept_counts)[:-1]))
+        from_end = kept_counts[rows] - (np.arange(len(ids)) - row_starts[rows]) - 1
+        columns = max_length - 1 - from_end
+        visible = columns >= 0
+        padded[rows[visible], columns[visible]] = ids[visible]
+        return padded
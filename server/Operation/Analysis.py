@@ -482,13 +482,51 @@
 #         """Context manager exit - close connection"""
 #         self.close_connection()
 
+import base64
+import datetime
+import json
 import pyodbc
-from typing import Union, Optional, Dict, List, Any
+from typing import Union, Optional, Dict, List, Any, Tuple
+from Operation.ConnectionPool import build_connection_string, get_pool
 import re
 from collections import defaultdict
 
+# Recommended indexes for paginated history reads: the first covers the keyset seek and the
+# summary projection without key lookups, the second serves the batched insights query.
+HISTORY_INDEX_DDL = """
+CREATE NONCLUSTERED INDEX IX_ANALYSIS_EMAIL_DATE_ID
+    ON ANALYSIS (EMAIL, ANALYSIS_DATE DESC, ANALYSIS_ID DESC)
+    INCLUDE (USERNAME, TWEETS_COUNT, AVERAGE_AGREEABLENESS, AVERAGE_CONSCIENTIOUSNESS,
+             AVERAGE_EXTRAVERSION, AVERAGE_NEUROTICISM, AVERAGE_OPENNESS);
+
+CREATE NONCLUSTERED INDEX IX_INSIGHTS_ANALYSIS_ID_TYPE
+    ON INSIGHTS (ANALYSIS_ID, INSIGHT_TYPE)
+    INCLUDE (INSIGHT_TEXT);
+"""
+
 
 class Analysis:
+    # SQL Server accepts at most 2100 parameters per statement
+    INSIGHTS_BATCH_SIZE = 1000
+
+    # Default and upper bound for one page of analysis history
+    DEFAULT_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 100
+
+    # Analyses per MERGE statement in add_analyses (9 parameters each, within the 2100 limit)
+    ANALYSIS_BATCH_SIZE = 200
+
+    ANALYSIS_INSERT_COLUMNS = (
+        "EMAIL, USERNAME, TWEETS_COUNT, AVERAGE_AGREEABLENESS, AVERAGE_CONSCIENTIOUSNESS, "
+        "AVERAGE_EXTRAVERSION, AVERAGE_NEUROTICISM, AVERAGE_OPENNESS"
+    )
+
+    # Columns returned by the summary projection (no insights)
+    SUMMARY_COLUMNS = (
+        "ANALYSIS_ID, EMAIL, USERNAME, TWEETS_COUNT, AVERAGE_AGREEABLENESS, AVERAGE_CONSCIENTIOUSNESS, "
+        "AVERAGE_EXTRAVERSION, AVERAGE_NEUROTICISM, AVERAGE_OPENNESS, ANALYSIS_DATE"
+    )
+
     def __init__(self,
                  email: Optional[str] = None,
                  username: Optional[str] = None,
@@ -508,6 +546,10 @@ class Analysis:
         self.db_password = None
         self.trusted_connection = None
         self.connection = None
+        self._pool = None
+
+        # Cursor of the next history page, set by get_analyses_by_user
+        self.next_cursor = None
 
     def get_connection(self,
                        server: Optional[str] = None,
@@ -524,33 +566,36 @@ class Analysis:
         self.db_password = db_password or self.db_password
         self.trusted_connection = trusted_connection if trusted_connection is not None else self.trusted_connection
 
-        if not self.server or not self.database:
-            raise ValueError("Server and database name are required")
-
         try:
-            self.close_connection()
+            conn_str = build_connection_string(
+                self.server, self.database, self.db_username, self.db_password, self.trusted_connection
+            )
 
-            if self.trusted_connection:
-                conn_str = f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={self.server};DATABASE={self.database};Trusted_Connection=yes;'
-            else:
-                if not self.db_username or not self.db_password:
-                    raise ValueError("Username and password are required for SQL Server Authentication")
-                conn_str = f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={self.server};DATABASE={self.database};UID={self.db_username};PWD={self.db_password}'
-
-            self.connection = pyodbc.connect(conn_str)
+            # Borrow a connection from the process-wide pool instead of opening a new one
+            self.close_connection()
+            self._pool = get_pool(conn_str)
+            self.connection = self._pool.acquire()
             return self.connection
 
+        except ValueError:
+            raise
         except pyodbc.Error as e:
             raise ConnectionError(f"Database connection error: {str(e)}")
+        except ConnectionError:
+            raise
         except Exception as e:
             raise Exception(f"Unexpected error while connecting to database: {str(e)}")
 
     def close_connection(self) -> None:
-        """Close the database connection"""
+        """Close the database connection (returned to the pool when pooled)"""
         if self.connection:
             try:
-                self.connection.close()
+                if self._pool is not None:
+                    self._pool.release(self.connection)
+                else:
+                    self.connection.close()
                 self.connection = None
+                self._pool = None
             except Exception as e:
                 raise ConnectionError(f"Error closing connection: {str(e)}")
 
@@ -565,11 +610,7 @@ class Analysis:
             ValueError: If required fields are missing
             ConnectionError: If database connection fails
         """
-        if not all([self.email, self.username, self.tweets_count is not None]):
-            raise ValueError("Email, username, and tweets_count are required")
-
-        if not self.average_scores or len(self.average_scores) != 5:
-            raise ValueError("All five average scores must be provided")
+        self._validate()
 
         if not self.connection:
             self.get_connection()
@@ -577,50 +618,17 @@ class Analysis:
         try:
             cursor = self.connection.cursor()
 
-            # Insert analysis record
-            insert_query = """
-            INSERT INTO ANALYSIS (
-                EMAIL, USERNAME, TWEETS_COUNT,
-                AVERAGE_AGREEABLENESS, AVERAGE_CONSCIENTIOUSNESS,
-                AVERAGE_EXTRAVERSION, AVERAGE_NEUROTICISM, AVERAGE_OPENNESS
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            # Insert analysis record; OUTPUT returns the new ID in the same round-trip
+            insert_query = f"""
+            INSERT INTO ANALYSIS ({self.ANALYSIS_INSERT_COLUMNS})
+            OUTPUT INSERTED.ANALYSIS_ID
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """
-
-            cursor.execute(insert_query, (
-                self.email, self.username, self.tweets_count,
-                self.average_scores.get('agreeableness'),
-                self.average_scores.get('conscientiousness'),
-                self.average_scores.get('extraversion'),
-                self.average_scores.get('neuroticism'),
-                self.average_scores.get('openness')
-            ))
-
-            # Get the new analysis ID
-            cursor.execute("SELECT @@IDENTITY")
+            cursor.execute(insert_query, self._analysis_row())
             self.analysis_id = int(cursor.fetchone()[0])
 
-            # Process insights if they exist - Group by type
-            if self.insights:
-                # Group insights by type
-                grouped_insights = defaultdict(list)
-                for insight in self.insights:
-                    insight_type = insight['type'].upper()
-                    grouped_insights[insight_type].append(insight['text'])
-
-                # Insert each grouped insight as a single record
-                for insight_type, texts in grouped_insights.items():
-                    # Join all insights of the same type with commas
-                    combined_text = ", ".join(texts)
-
-                    insert_query = """
-                    INSERT INTO INSIGHTS (ANALYSIS_ID, INSIGHT_TYPE, INSIGHT_TEXT)
-                    VALUES (?, ?, ?)
-                    """
-                    cursor.execute(insert_query, (
-                        self.analysis_id,
-                        insight_type,
-                        combined_text
-                    ))
+            # Insert all insight rows in one batched call
+            self._insert_insights(cursor, self._insight_rows())
 
             self.connection.commit()
             return self.analysis_id
@@ -633,6 +641,122 @@ class Analysis:
                 self.connection.rollback()
             raise Exception(f"Error adding analysis: {str(e)}")
 
+    def add_analyses(self, analyses: List['Analysis']) -> List[int]:
+        """
+        Persist many analyses and their insights in a single transaction.
+
+        Analysis rows are inserted in multi-row MERGE statements whose OUTPUT clause maps
+        each source row to its new ANALYSIS_ID; insights for the whole batch are then
+        written with one fast_executemany call. Nothing is written if any row fails.
+
+        Args:
+            analyses: Analysis objects to persist; their analysis_id is set on success
+
+        Returns:
+            list: The new analysis IDs, in the order of the given analyses
+
+        Raises:
+            ValueError: If required fields are missing on any analysis
+            ConnectionError: If database connection fails
+        """
+        for analysis in analyses:
+            analysis._validate()
+
+        if not analyses:
+            return []
+
+        if not self.connection:
+            self.get_connection()
+
+        try:
+            cursor = self.connection.cursor()
+            analysis_ids = [None] * len(analyses)
+            source_columns = ", ".join(f"source.{column.strip()}" for column in self.ANALYSIS_INSERT_COLUMNS.split(","))
+
+            for start in range(0, len(analyses), self.ANALYSIS_BATCH_SIZE):
+                batch = analyses[start:start + self.ANALYSIS_BATCH_SIZE]
+                values = ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(batch))
+                merge_query = f"""
+                MERGE INTO ANALYSIS AS target
+                USING (VALUES {values}) AS source (ROW_NUM, {self.ANALYSIS_INSERT_COLUMNS})
+                ON 1 = 0
+                WHEN NOT MATCHED THEN
+                    INSERT ({self.ANALYSIS_INSERT_COLUMNS})
+                    VALUES ({source_columns})
+                OUTPUT source.ROW_NUM, INSERTED.ANALYSIS_ID;
+                """
+                params = []
+                for row_num, analysis in enumerate(batch, start):
+                    params.append(row_num)
+                    params.extend(analysis._analysis_row())
+                cursor.execute(merge_query, params)
+
+                # OUTPUT rows are not guaranteed to follow VALUES order, hence ROW_NUM
+                for row_num, analysis_id in cursor.fetchall():
+                    analysis_ids[row_num] = int(analysis_id)
+
+            insight_rows = []
+            for analysis, analysis_id in zip(analyses, analysis_ids):
+                analysis.analysis_id = analysis_id
+                insight_rows.extend(analysis._insight_rows())
+            self._insert_insights(cursor, insight_rows)
+
+            self.connection.commit()
+            return analysis_ids
+
+        except pyodbc.Error as e:
+            self.connection.rollback()
+            raise pyodbc.Error(f"Database error while adding analyses: {str(e)}") from e
+        except Exception as e:
+            if self.connection:
+                self.connection.rollback()
+            raise Exception(f"Error adding analyses: {str(e)}")
+
+    def _validate(self) -> None:
+        if not all([self.email, self.username, self.tweets_count is not None]):
+            raise ValueError("Email, username, and tweets_count are required")
+
+        if not self.average_scores or len(self.average_scores) != 5:
+            raise ValueError("All five average scores must be provided")
+
+    def _analysis_row(self) -> tuple:
+        """Values for ANALYSIS_INSERT_COLUMNS"""
+        return (
+            self.email, self.username, self.tweets_count,
+            self.average_scores.get('agreeableness'),
+            self.average_scores.get('conscientiousness'),
+            self.average_scores.get('extraversion'),
+            self.average_scores.get('neuroticism'),
+            self.average_scores.get('openness')
+        )
+
+    def _insight_rows(self) -> List[tuple]:
+        """(ANALYSIS_ID, INSIGHT_TYPE, INSIGHT_TEXT) rows, one per insight type"""
+        # Group insights by type
+        grouped_insights = defaultdict(list)
+        for insight in self.insights:
+            insight_type = insight['type'].upper()
+            grouped_insights[insight_type].append(insight['text'])
+
+        # Each grouped insight is stored as a single record, texts joined with commas
+        return [
+            (self.analysis_id, insight_type, ", ".join(texts))
+            for insight_type, texts in grouped_insights.items()
+        ]
+
+    @staticmethod
+    def _insert_insights(cursor, rows: List[tuple]) -> None:
+        if not rows:
+            return
+
+        insert_query = """
+        INSERT INTO INSIGHTS (ANALYSIS_ID, INSIGHT_TYPE, INSIGHT_TEXT)
+        VALUES (?, ?, ?)
+        """
+        # Send all parameter sets in one round-trip (pyodbc array binding)
+        cursor.fast_executemany = True
+        cursor.executemany(insert_query, rows)
+
     def get_analysis_by_id(self, analysis_id: int) -> Union[Dict[str, Any], None]:
         """
         Retrieve an analysis record by ID along with its insights.
@@ -687,58 +811,96 @@ class Analysis:
         except Exception as e:
             raise Exception(f"Error retrieving analysis: {str(e)}")
 
-    def get_analyses_by_user(self, email: str) -> List[Dict[str, Any]]:
+    def get_analyses_by_user(self,
+                             email: str,
+                             page_size: Optional[int] = None,
+                             cursor: Optional[str] = None,
+                             summary_only: bool = False) -> List[Dict[str, Any]]:
         """
-        Retrieve all analysis records for a specific user.
+        Retrieve analysis records for a specific user, newest first.
+
+        Analyses and insights are fetched with two queries in total (insights are
+        batched with IN lists) rather than one insights query per analysis.
+
+        Without page_size or cursor the whole history is returned. Otherwise one page is
+        read with a keyset seek on (ANALYSIS_DATE, ANALYSIS_ID) and self.next_cursor is set
+        to the cursor of the following page, or None on the last page.
 
         Args:
             email: User's email address
+            page_size: Number of analyses per page (capped at MAX_PAGE_SIZE)
+            cursor: Opaque cursor returned by the previous page
+            summary_only: Return the analysis rows without their insights
 
         Returns:
             list: List of analysis records with their insights
 
         Raises:
-            ValueError: If email is not provided
+            ValueError: If email is not provided or the cursor is invalid
             ConnectionError: If database connection fails
         """
         if not email:
             raise ValueError("Email is required")
 
+        paginated = page_size is not None or cursor is not None
+        if paginated:
+            page_size = min(max(int(page_size or self.DEFAULT_PAGE_SIZE), 1), self.MAX_PAGE_SIZE)
+        after = self.decode_cursor(cursor) if cursor else None
+        self.next_cursor = None
+
         if not self.connection:
             self.get_connection()
 
         try:
-            cursor = self.connection.cursor()
-
-            # Get all analyses for the user
-            analysis_query = "SELECT * FROM ANALYSIS WHERE EMAIL = ? ORDER BY ANALYSIS_DATE DESC"
-            cursor.execute(analysis_query, email)
-            analyses = cursor.fetchall()
+            db_cursor = self.connection.cursor()
+            # Qualified so the seek query's derived table adds no column
+            columns_sql = self.SUMMARY_COLUMNS if summary_only else "ANALYSIS.*"
+
+            if not paginated:
+                # Get all analyses for the user
+                analysis_query = (
+                    f"SELECT {columns_sql} FROM ANALYSIS WHERE EMAIL = ? "
+                    "ORDER BY ANALYSIS_DATE DESC, ANALYSIS_ID DESC"
+                )
+                db_cursor.execute(analysis_query, (email,))
+            elif after is None:
+                # First page; one extra row tells whether another page exists
+                analysis_query = (
+                    f"SELECT TOP (?) {columns_sql} FROM ANALYSIS WHERE EMAIL = ? "
+                    "ORDER BY ANALYSIS_DATE DESC, ANALYSIS_ID DESC"
+                )
+                db_cursor.execute(analysis_query, (page_size + 1, email))
+            else:
+                # Seek past the last row of the previous page. Its date is re-read from the row
+                # itself: a DATETIME column is rounded to 1/300 s, so the decoded timestamp may not
+                # equal the stored value. The cursor's date is only used if that row is gone. The
+                # anchor must belong to the same user, so another user's row cannot position the seek.
+                analysis_date, analysis_id = after
+                analysis_query = (
+                    f"SELECT TOP (?) {columns_sql} FROM ANALYSIS "
+                    "CROSS JOIN (SELECT COALESCE("
+                    "(SELECT ANALYSIS_DATE FROM ANALYSIS WHERE ANALYSIS_ID = ? AND EMAIL = ?), ?) "
+                    "AS SEEK_DATE) AS seek "
+                    "WHERE EMAIL = ? "
+                    "AND (ANALYSIS_DATE < seek.SEEK_DATE OR (ANALYSIS_DATE = seek.SEEK_DATE AND ANALYSIS_ID < ?)) "
+                    "ORDER BY ANALYSIS_DATE DESC, ANALYSIS_ID DESC"
+                )
+                db_cursor.execute(analysis_query, (page_size + 1, analysis_id, email, analysis_date, email, analysis_id))
+            analyses = db_cursor.fetchall()
 
             if not analyses:
                 return []
 
             # Convert to list of dictionaries
-            columns = [column[0] for column in cursor.description]
-            analysis_list = []
+            columns = [column[0] for column in db_cursor.description]
+            analysis_list = [dict(zip(columns, analysis)) for analysis in analyses]
 
-            for analysis in analyses:
-                analysis_dict = dict(zip(columns, analysis))
-                analysis_id = analysis_dict['ANALYSIS_ID']
-
-                # Get insights for this analysis
-                insights_query = "SELECT * FROM INSIGHTS WHERE ANALYSIS_ID = ? ORDER BY INSIGHT_TYPE"
-                cursor.execute(insights_query, analysis_id)
-                insights = cursor.fetchall()
-
-                if insights:
-                    insight_columns = [column[0] for column in cursor.description]
-                    analysis_dict['insights'] = [
-                        dict(zip(insight_columns, insight)) for insight in insights
-                    ]
-
-                analysis_list.append(analysis_dict)
+            if paginated and len(analysis_list) > page_size:
+                analysis_list = analysis_list[:page_size]
+                self.next_cursor = self.encode_cursor(analysis_list[-1])
 
+            if not summary_only:
+                self._attach_insights(db_cursor, analysis_list)
             return analysis_list
 
         except pyodbc.Error as e:
@@ -746,6 +908,59 @@ class Analysis:
         except Exception as e:
             raise Exception(f"Error retrieving user analyses: {str(e)}")
 
+    @staticmethod
+    def encode_cursor(analysis: Dict[str, Any]) -> str:
+        """
+        Opaque pagination cursor for the position after the given analysis row
+
+        The seek re-reads the row's stored date by ANALYSIS_ID; the encoded date is only a
+        fallback for when that row has been deleted since.
+        """
+        analysis_date = analysis['ANALYSIS_DATE']
+        if isinstance(analysis_date, datetime.datetime):
+            analysis_date = analysis_date.isoformat()
+        payload = json.dumps([analysis_date, analysis['ANALYSIS_ID']]).encode('utf-8')
+        return base64.urlsafe_b64encode(payload).decode('ascii')
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime.datetime, int]:
+        """
+        Decode a cursor created by encode_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            analysis_date, analysis_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            return datetime.datetime.fromisoformat(analysis_date), int(analysis_id)
+        except Exception:
+            raise ValueError("Invalid pagination cursor")
+
+    def _attach_insights(self, cursor, analysis_list: List[Dict[str, Any]]) -> None:
+        """
+        Load the insights of many analyses at once and nest them under 'insights'.
+
+        Analyses without insights are left without the key, as get_analysis_by_id does.
+        """
+        by_id = {analysis['ANALYSIS_ID']: analysis for analysis in analysis_list}
+        analysis_ids = list(by_id)
+
+        for start in range(0, len(analysis_ids), self.INSIGHTS_BATCH_SIZE):
+            batch = analysis_ids[start:start + self.INSIGHTS_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            insights_query = (
+                f"SELECT * FROM INSIGHTS WHERE ANALYSIS_ID IN ({placeholders}) "
+                "ORDER BY ANALYSIS_ID, INSIGHT_TYPE"
+            )
+            cursor.execute(insights_query, batch)
+            insights = cursor.fetchall()
+
+            if insights:
+                insight_columns = [column[0] for column in cursor.description]
+                for insight in insights:
+                    insight_dict = dict(zip(insight_columns, insight))
+                    by_id[insight_dict['ANALYSIS_ID']].setdefault('insights', []).append(insight_dict)
+
     def delete_analysis(self, analysis_id: int) -> bool:
         """
         Delete an analysis record and its associated insights.
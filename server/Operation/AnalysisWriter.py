@@ -0,0 +1,419 @@
+import glob
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List
+
+import pyodbc
+
+from Core.Metrics import Histogram
+from Operation.Analysis import Analysis
+
+
+# SQLSTATEs worth retrying: connection exceptions (08xxx), timeouts and deadlock victims
+TRANSIENT_SQLSTATES = ('08', 'HYT00', 'HYT01', '40001')
+
+
+class AnalysisWriter:
+    def __init__(self,
+                 connection_params: Dict[str, Any],
+                 batch_size: int = 100,
+                 max_wait_ms: float = 200.0,
+                 max_retries: int = 5,
+                 retry_backoff: float = 0.5,
+                 max_backoff: float = 30.0,
+                 spill_file: str = '../pending_analyses.jsonl',
+                 dead_letter_file: str = '../failed_analyses.jsonl',
+                 replay_interval: float = 30.0,
+                 stale_replay_seconds: float = 600.0,
+                 max_statuses: int = 10000):
+        """
+        Write-behind queue that persists analyses on a background thread
+
+        Requests enqueue their Analysis and return a pending ID straight away. The writer
+        drains the queue in batches through Analysis.add_analyses. Connection-level failures
+        are retried with exponential backoff, and batches it still cannot write are appended to
+        a JSON-lines spill file that is replayed once the database is reachable again (also
+        after a restart, as soon as start() runs). Any other failure splits the batch so one bad
+        record cannot hold back the rest; records that fail on their own go to the dead-letter
+        file and are not retried.
+
+        Args:
+            connection_params (dict): Keyword arguments for Analysis.get_connection
+            batch_size (int): Maximum number of analyses written per transaction
+            max_wait_ms (float): How long the first queued analysis waits for a batch to fill
+            max_retries (int): Write attempts per batch before it is spilled to disk
+            retry_backoff (float): Initial delay between attempts in seconds (doubled each retry)
+            max_backoff (float): Upper bound for the delay between attempts
+            spill_file (str): JSON-lines file holding analyses that could not be written
+            dead_letter_file (str): JSON-lines file holding analyses rejected by the database
+            replay_interval (float): Seconds between attempts to replay the spill file
+            stale_replay_seconds (float): Age after which another process's claimed replay file
+                                          is treated as abandoned and replayed here
+            max_statuses (int): Number of pending IDs whose status is remembered
+        """
+        self.connection_params = connection_params
+        self.batch_size = batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self.spill_file = spill_file
+        self.dead_letter_file = dead_letter_file
+        self.replay_interval = replay_interval
+        self.stale_replay_seconds = stale_replay_seconds
+        self.max_statuses = max_statuses
+
+        self._queue = queue.Queue()
+        self._statuses = OrderedDict()
+        self._status_lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._start_lock = threading.Lock()
+        self._worker = None
+        self._last_replay = 0.0
+
+        # Metrics
+        self.batch_size_histogram = Histogram('write_batch_size', [1, 2, 5, 10, 25, 50, 100, 250, 500])
+        self.write_ms_histogram = Histogram('write_ms', [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000])
+        self.saved = 0
+        self.failed_attempts = 0
+        self.spilled = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        """Start the writer thread if it is not running yet"""
+        with self._start_lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._stopped.clear()
+            self._worker = threading.Thread(target=self._run, name='AnalysisWriter', daemon=True)
+            self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the writer thread; analyses it cannot write before stopping are spilled"""
+        self._stopped.set()
+        self._queue.put(None)  # Wake the worker up
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+
+    def submit(self, analysis: Analysis) -> str:
+        """
+        Queue an analysis for saving
+
+        Args:
+            analysis (Analysis): Analysis with email, username, tweets_count, scores and insights
+
+        Returns:
+            str: Pending ID to look the save status up with status()
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        analysis._validate()
+
+        record = {
+            'pending_id': uuid.uuid4().hex,
+            'email': analysis.email,
+            'username': analysis.username,
+            'tweets_count': analysis.tweets_count,
+            'average_scores': analysis.average_scores,
+            'insights': analysis.insights,
+            'queued_at': time.time()
+        }
+        self._set_status(record['pending_id'], 'pending')
+        self.start()
+        self._queue.put(record)
+        return record['pending_id']
+
+    def status(self, pending_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Save status of a pending ID
+
+        Statuses live in memory in this process only: another worker, or this one after a
+        restart, does not know the ID until it replays the spilled record carrying it. The
+        spill and dead-letter files keep each record's last status and error on disk.
+
+        Returns:
+            dict: {'status': 'pending'|'saved'|'spilled'|'failed', 'analysis_id', 'attempts', 'error'},
+                  or None for unknown (or long forgotten) IDs
+        """
+        with self._status_lock:
+            status = self._statuses.get(pending_id)
+            return dict(status) if status else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._spill_lock:
+            spill_exists = os.path.exists(self.spill_file)
+        return {
+            'queue_depth': self._queue.qsize(),
+            'saved': self.saved,
+            'failed_attempts': self.failed_attempts,
+            'spilled': self.spilled,
+            'failed': self.failed,
+            'spill_file_pending': spill_exists,
+            'batch_size': self.batch_size_histogram.snapshot(),
+            'write_ms': self.write_ms_histogram.snapshot()
+        }
+
+    def _set_status(self, pending_id: str, status: str, **details) -> None:
+        with self._status_lock:
+            entry = self._statuses.pop(pending_id, None) or {'attempts': 0}
+            entry.update(details, status=status)
+            self._statuses[pending_id] = entry
+            while len(self._statuses) > self.max_statuses:
+                self._statuses.popitem(last=False)
+
+    def _run(self) -> None:
+        while True:
+            self._maybe_replay()
+            try:
+                first = self._queue.get(timeout=self.replay_interval)
+            except queue.Empty:
+                continue
+
+            if first is None:
+                if self._stopped.is_set():
+                    self._drain_on_stop()
+                    return
+                continue
+
+            batch = self._collect_batch(first)
+            self._write(batch)
+
+    def _collect_batch(self, first: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Gather records until the batch is full or max_wait has passed"""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                record = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if record is None:
+                self._queue.put(None)  # Let the main loop see the stop request
+                break
+            batch.append(record)
+        return batch
+
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        """Whether a failed write may succeed later unchanged (database down, timeout, deadlock)"""
+        if isinstance(error, ConnectionError):
+            # Raised by get_connection and the connection pool
+            return True
+        cause = error.__cause__ or error
+        if isinstance(cause, (pyodbc.OperationalError, pyodbc.InterfaceError)):
+            return True
+        sqlstate = cause.args[0] if cause.args and isinstance(cause.args[0], str) else ''
+        return sqlstate.startswith(TRANSIENT_SQLSTATES)
+
+    def _write(self, batch: List[Dict[str, Any]]) -> bool:
+        """
+        Persist a batch, retrying connection-level failures with exponential backoff
+
+        Returns:
+            bool: False if the batch was spilled because the database stayed unreachable
+        """
+        error = None
+        for attempt in range(self.max_retries):
+            started = time.perf_counter()
+            try:
+                analysis_ids = self._persist(batch)
+            except Exception as e:
+                error = e
+                self.failed_attempts += 1
+                print(f"Failed to save {len(batch)} analyses (attempt {attempt + 1}/{self.max_retries}): {str(e)}")
+                if not self._is_transient(e):
+                    if len(batch) == 1:
+                        self._dead_letter(batch[0], e)
+                        return True
+                    return self._write_each(batch)
+                for record in batch:
+                    self._set_status(record['pending_id'], 'pending',
+                                     attempts=attempt + 1, error=str(e))
+                if self._stopped.wait(min(self.retry_backoff * 2 ** attempt, self.max_backoff)):
+                    break
+                continue
+
+            self.write_ms_histogram.observe((time.perf_counter() - started) * 1000.0)
+            self.batch_size_histogram.observe(len(batch))
+            self.saved += len(batch)
+            for record, analysis_id in zip(batch, analysis_ids):
+                self._set_status(record['pending_id'], 'saved', analysis_id=analysis_id, error=None)
+            return True
+
+        self._spill(batch, error)
+        return False
+
+    def _write_each(self, batch: List[Dict[str, Any]]) -> bool:
+        """Write records one at a time after a batch was rejected, dead-lettering the bad ones"""
+        for index, record in enumerate(batch):
+            started = time.perf_counter()
+            try:
+                analysis_id = self._persist([record])[0]
+            except Exception as e:
+                self.failed_attempts += 1
+                if self._is_transient(e):
+                    # The database went away mid-way; the rest is retried with the next replay
+                    self._spill(batch[index:], e)
+                    return False
+                self._dead_letter(record, e)
+                continue
+
+            self.write_ms_histogram.observe((time.perf_counter() - started) * 1000.0)
+            self.batch_size_histogram.observe(1)
+            self.saved += 1
+            self._set_status(record['pending_id'], 'saved', analysis_id=analysis_id, error=None)
+        return True
+
+    def _dead_letter(self, record: Dict[str, Any], error: Exception) -> None:
+        """Set a record the database rejects aside for inspection instead of retrying it forever"""
+        with self._spill_lock:
+            with open(self.dead_letter_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({**record, 'status': 'failed', 'error': str(error)}) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        self.failed += 1
+        self._set_status(record['pending_id'], 'failed', error=str(error))
+        print(f"Analysis {record['pending_id']} rejected by the database, moved to {self.dead_letter_file}: {str(error)}")
+
+    def _persist(self, batch: List[Dict[str, Any]]) -> List[int]:
+        analyses = []
+        for record in batch:
+            analysis = Analysis(
+                email=record['email'],
+                username=record['username'],
+                tweets_count=record['tweets_count'],
+                average_scores=record['average_scores']
+            )
+            analysis.insights = record['insights']
+            analyses.append(analysis)
+
+        writer = Analysis()
+        try:
+            writer.get_connection(**self.connection_params)
+            return writer.add_analyses(analyses)
+        finally:
+            writer.close_connection()
+
+    def _spill(self, batch: List[Dict[str, Any]], error: Optional[Exception]) -> None:
+        """Append records to the spill file, fsynced so they survive a crash"""
+        if not batch:
+            return
+        with self._spill_lock:
+            with open(self.spill_file, 'a', encoding='utf-8') as f:
+                for record in batch:
+                    # The status travels with the record so it survives a restart
+                    f.write(json.dumps({**record, 'status': 'spilled', 'error': str(error) if error else None}) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        self.spilled += len(batch)
+        for record in batch:
+            self._set_status(record['pending_id'], 'spilled', error=str(error) if error else None)
+        print(f"Spilled {len(batch)} analyses to {self.spill_file}")
+
+    def _maybe_replay(self) -> None:
+        """Re-queue spilled records every replay_interval seconds"""
+        now = time.monotonic()
+        if self._last_replay and now - self._last_replay < self.replay_interval:
+            return
+        self._last_replay = now
+
+        with self._spill_lock:
+            replay_file = self._claim_replay_file()
+            if replay_file is None:
+                return
+
+            records = []
+            with open(replay_file, encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        try:
+                            records.append(json.loads(line))
+                        except ValueError:
+                            print(f"Skipping corrupt spilled analysis: {line[:100]}")
+
+        print(f"Replaying {len(records)} spilled analyses")
+        for start in range(0, len(records), self.batch_size):
+            batch = records[start:start + self.batch_size]
+            for record in batch:
+                self._set_status(record['pending_id'], 'pending', error=record.pop('error', None))
+                record.pop('status', None)
+            if not self._write(batch):
+                # Database still unavailable: put the rest back without retrying each batch
+                self._spill(records[start + self.batch_size:], None)
+                break
+            # Keep the claim fresh so other workers do not adopt it while the replay is slow
+            self._touch(replay_file)
+
+        with self._spill_lock:
+            try:
+                os.remove(replay_file)
+            except FileNotFoundError:
+                pass
+
+    def _claim_replay_file(self) -> Optional[str]:
+        """
+        Atomically take ownership of spilled records, so concurrent workers never replay the same file
+
+        Every worker process shares the spill file. A worker claims it by renaming it to a name
+        suffixed with its own pid; os.rename succeeds for exactly one of them and the others see
+        FileNotFoundError. Claimed files left behind by a process that died mid-replay are
+        adopted the same way once they have not been touched for stale_replay_seconds.
+
+        Returns:
+            str: Path of the claimed replay file, or None if there is nothing to replay
+        """
+        claimed = f"{self.spill_file}.replay.{os.getpid()}"
+        if os.path.exists(claimed):
+            return claimed
+
+        for leftover in glob.glob(f"{glob.escape(self.spill_file)}.replay*"):
+            try:
+                # Unsuffixed .replay files predate per-process claims and are always leftovers
+                if not leftover.endswith('.replay') and \
+                        time.time() - os.path.getmtime(leftover) < self.stale_replay_seconds:
+                    continue
+                os.rename(leftover, claimed)
+            except OSError:
+                # Claimed by another worker first (or still open there)
+                continue
+            self._touch(claimed)
+            return claimed
+
+        try:
+            os.rename(self.spill_file, claimed)
+        except OSError:
+            return None
+        self._touch(claimed)
+        return claimed
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _drain_on_stop(self) -> None:
+        """Spill whatever is still queued so it is written after the next start"""
+        batch = []
+        while True:
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is not None:
+                batch.append(record)
+        if batch:
+            self._spill(batch, None)
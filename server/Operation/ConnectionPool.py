@@ -0,0 +1,261 @@
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Any, List
+
+import pyodbc
+
+from Core.Metrics import Histogram
+
+
+def build_connection_string(server: Optional[str],
+                            database: Optional[str],
+                            db_username: Optional[str] = None,
+                            db_password: Optional[str] = None,
+                            trusted_connection: Optional[bool] = None) -> str:
+    """
+    Build the ODBC connection string shared by User and Analysis
+
+    Raises:
+        ValueError: If server/database or SQL Server Authentication credentials are missing
+    """
+    if not server or not database:
+        raise ValueError("Server and database name are required")
+
+    if trusted_connection:
+        return f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={server};DATABASE={database};Trusted_Connection=yes;'
+
+    if not db_username or not db_password:
+        raise ValueError("Username and password are required for SQL Server Authentication")
+    return f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={server};DATABASE={database};UID={db_username};PWD={db_password}'
+
+
+class _PoolEntry:
+    def __init__(self, connection):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class ConnectionPool:
+    def __init__(self, conn_str: str,
+                 min_size: int = 1,
+                 max_size: int = 10,
+                 acquire_timeout: float = 10.0,
+                 idle_timeout: float = 300.0,
+                 health_check_after: float = 30.0,
+                 connect=pyodbc.connect):
+        """
+        Thread-safe pool of open database connections
+
+        Args:
+            conn_str (str): ODBC connection string
+            min_size (int): Idle connections kept open even when they exceed idle_timeout
+            max_size (int): Maximum number of open connections (idle + checked out)
+            acquire_timeout (float): Seconds to wait for a free connection before failing
+            idle_timeout (float): Seconds after which surplus idle connections are closed
+            health_check_after (float): Idle seconds after which a connection is pinged on checkout
+            connect: Connection factory (pyodbc.connect)
+        """
+        self.conn_str = conn_str
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self._connect = connect
+
+        self._idle = deque()  # Most recently returned connection on the right (LIFO keeps them warm)
+        self._in_use = {}
+        self._size = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+        # Metrics
+        self.wait_histogram = Histogram('pool_wait_ms', [0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000])
+        self.checkouts = 0
+        self.timeouts = 0
+        self.created = 0
+        self.closed = 0
+        self.failed_health_checks = 0
+
+    def acquire(self):
+        """
+        Check a connection out of the pool, opening a new one while below max_size
+
+        Raises:
+            ConnectionError: If the pool is closed, no connection frees up within acquire_timeout
+                or connecting fails
+        """
+        started = time.monotonic()
+        deadline = started + self.acquire_timeout
+
+        while True:
+            entry = None
+            expired = []
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise ConnectionError("Connection pool is closed")
+                    expired.extend(self._evict_idle())
+                    if self._idle:
+                        entry = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1  # Reserve the slot; connect outside the lock
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.timeouts += 1
+                        raise ConnectionError(
+                            f"Timed out after {self.acquire_timeout}s waiting for a database connection")
+                    self._cond.wait(remaining)
+
+            self._close_all(expired)
+
+            if entry is None:
+                try:
+                    entry = _PoolEntry(self._connect(self.conn_str))
+                except Exception:
+                    self._release_slot()
+                    raise
+                with self._cond:
+                    self.created += 1
+            elif not self._is_healthy(entry):
+                self.failed_health_checks += 1
+                self._discard(entry)
+                continue
+
+            with self._cond:
+                self._in_use[id(entry.connection)] = entry
+                self.checkouts += 1
+            self.wait_histogram.observe((time.monotonic() - started) * 1000.0)
+            return entry.connection
+
+    def release(self, connection, discard: bool = False) -> None:
+        """Return a checked-out connection; uncommitted work is rolled back first"""
+        with self._cond:
+            entry = self._in_use.pop(id(connection), None)
+        if entry is None:
+            return
+
+        if not discard:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+
+        entry.last_used = time.monotonic()
+        with self._cond:
+            if not discard and not self._closed:
+                self._idle.append(entry)
+                self._cond.notify()
+                return
+
+        # Closed pools keep nothing open, including connections returned after close()
+        self._discard(entry)
+
+    def close(self) -> None:
+        """Close all idle connections (checked-out ones are closed when released)"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        self._close_all(idle)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': len(self._in_use),
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'created': self.created,
+                'closed': self.closed,
+                'failed_health_checks': self.failed_health_checks,
+                'wait_ms': self.wait_histogram.snapshot()
+            }
+
+    def _is_healthy(self, entry: _PoolEntry) -> bool:
+        # Connections used moments ago are trusted; older ones get a round-trip ping
+        if time.monotonic() - entry.last_used < self.health_check_after:
+            return True
+        try:
+            cursor = entry.connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def _evict_idle(self) -> List[_PoolEntry]:
+        """Pop surplus idle connections past idle_timeout (caller holds the lock)"""
+        now = time.monotonic()
+        expired = []
+        # Oldest idle connections sit on the left
+        while len(self._idle) > self.min_size and now - self._idle[0].last_used > self.idle_timeout:
+            expired.append(self._idle.popleft())
+        self._size -= len(expired)
+        return expired
+
+    def _discard(self, entry: _PoolEntry) -> None:
+        self._close_all([entry])
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _close_all(self, entries: List[_PoolEntry]) -> None:
+        for entry in entries:
+            try:
+                entry.connection.close()
+            except Exception:
+                pass
+        if entries:
+            with self._cond:
+                self.closed += len(entries)
+
+
+# Process-wide pools keyed by connection string
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+_pool_settings: Dict[str, Any] = {}
+
+
+def configure_pools(**settings) -> None:
+    """Set ConnectionPool keyword arguments used for pools created from now on"""
+    with _pools_lock:
+        _pool_settings.update(settings)
+
+
+def get_pool(conn_str: str) -> ConnectionPool:
+    pool = _pools.get(conn_str)
+    if pool is not None:
+        return pool
+
+    with _pools_lock:
+        pool = _pools.get(conn_str)
+        if pool is None:
+            pool = ConnectionPool(conn_str, **_pool_settings)
+            _pools[conn_str] = pool
+        return pool
+
+
+def pool_stats() -> List[Dict[str, Any]]:
+    """Stats for every pool; the connection string is reduced to server and database"""
+    with _pools_lock:
+        pools = list(_pools.values())
+
+    stats = []
+    for pool in pools:
+        parts = dict(part.split('=', 1) for part in pool.conn_str.split(';') if '=' in part)
+        stats.append({'server': parts.get('SERVER'), 'database': parts.get('DATABASE'), **pool.stats()})
+    return stats
@@ -3,6 +3,7 @@ import hashlib
 import secrets
 import pyodbc
 from typing import Union, Optional, Dict, Any
+from Operation.ConnectionPool import build_connection_string, get_pool
 
 
 class User:
@@ -18,6 +19,7 @@ class User:
         self.db_password = None
         self.trusted_connection = None
         self.connection = None
+        self._pool = None
 
     def _hash_password(self, password: str) -> str:
         """
@@ -76,32 +78,36 @@ class User:
         self.db_password = db_password or self.db_password
         self.trusted_connection = trusted_connection if trusted_connection is not None else self.trusted_connection
 
-        if not self.server or not self.database:
-            raise ValueError("Server and database name are required")
-
         try:
-            if self.trusted_connection:
-                conn_str = f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={self.server};DATABASE={self.database};Trusted_Connection=yes;'
-            else:
-                if not self.db_username or not self.db_password:
-                    raise ValueError("Username and password are required for SQL Server Authentication")
-                conn_str = f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={self.server};DATABASE={self.database};UID={self.db_username};PWD={self.db_password}'
+            conn_str = build_connection_string(
+                self.server, self.database, self.db_username, self.db_password, self.trusted_connection
+            )
 
+            # Borrow a connection from the process-wide pool instead of opening a new one
             self.close_connection()
-            self.connection = pyodbc.connect(conn_str)
+            self._pool = get_pool(conn_str)
+            self.connection = self._pool.acquire()
             return self.connection
 
+        except ValueError:
+            raise
         except pyodbc.Error as e:
             raise ConnectionError(f"Database connection error: {str(e)}")
+        except ConnectionError:
+            raise
         except Exception as e:
             raise Exception(f"Unexpected error while connecting to database: {str(e)}")
 
     def close_connection(self) -> None:
-        """Close the database connection with error handling"""
+        """Close the database connection with error handling (returned to the pool when pooled)"""
         if self.connection:
             try:
-                self.connection.close()
+                if self._pool is not None:
+                    self._pool.release(self.connection)
+                else:
+                    self.connection.close()
                 self.connection = None
+                self._pool = None
             except Exception as e:
                 raise ConnectionError(f"Error closing connection: {str(e)}")
 